@@ -1,14 +1,11 @@
 from __future__ import annotations
-import argparse, datetime as dt
+import argparse, datetime as dt, sys
 import json
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich.table import Table
-from rich.columns import Columns
-from rich import box
 from .model import Task
 from .storage import (
     FileLock,
@@ -19,18 +16,11 @@ from .storage import (
     BACKUP_KEEP_DEFAULT,
     archive_path_for_db,
     append_tasks_to_archive,
+    load_db,
     save_db,
     migrate_db_data,
 )
-from .ui import pick_tasks_to_done
-from .render import (
-    render_tasks_table,
-    render_tasks_plain,
-    calculate_statistics,
-    render_statistics_dashboard,
-)
 from .housekeeping import resolve_db_path, init_config
-from .config import load_config
 from .paths import config_path
 
 console = Console()
@@ -77,6 +67,9 @@ class RichHelpFormatter(argparse.RawDescriptionHelpFormatter):
 
 def _print_rich_help(parser: argparse.ArgumentParser, subcommand: str = None) -> None:
     """Print help using Rich formatting"""
+    from rich.table import Table
+    from rich import box
+
     console.print()
 
     def _style_epilog_block(epilog: str) -> Text:
@@ -253,11 +246,7 @@ def _print_rich_help(parser: argparse.ArgumentParser, subcommand: str = None) ->
         table.add_column("Description", style="white")
 
         # Get subcommands
-        subparsers = None
-        for action in parser._actions:
-            if isinstance(action, argparse._SubParsersAction):
-                subparsers = action
-                break
+        subparsers = getattr(parser, "_todo_subparsers", None)
 
         if subparsers:
             for name, subparser in subparsers.choices.items():
@@ -308,28 +297,9 @@ def _print_rich_help(parser: argparse.ArgumentParser, subcommand: str = None) ->
             console.print()
 
         # Dedicated DB initialization / setup section (separate from Examples)
-        setup = """
-Initialize & DB Setup:
-  todo init                           # create config + DB (if missing)
-  todo init --dir ~/Documents/todo-cli --force
-  todo init --db-path ~/Documents/todo-cli/todos.json --force
-
-Temporary override (no config change):
-  todo --db ./todos.json ls
-  TODO_DB=./todos.json todo ls
-
-Verify which DB is in use:
-  todo config
-  todo path
-
-Precedence:
-  --db > TODO_DB env > config > default
-        """.strip(
-            "\n"
-        )
         console.print(
             Panel(
-                _style_epilog_block(setup),
+                _style_epilog_block(_SETUP_GUIDE),
                 title="[bold]Initialize & DB Setup[/bold]",
                 border_style="bright_blue",
             )
@@ -387,7 +357,14 @@ def find_task(tasks: List[Task], tid: int) -> Task:
     raise SystemExit(1)
 
 
+def _print_no_change(tid: int) -> None:
+    """Report that a mutation was a no-op (the DB is left untouched)."""
+    console.print(f"[dim](no change) #{tid}[/dim]")
+
+
 def cmd_init(args, _db_path: Path) -> None:
+    from .config import load_config
+
     cfg_before = load_config()
     cfg_p, db_p = init_config(
         db=args.db_path or None, dir_=args.dir or None, force=args.force
@@ -411,6 +388,8 @@ def cmd_init(args, _db_path: Path) -> None:
 
 
 def cmd_config(args, db_path: Path) -> None:
+    from .config import load_config
+
     cfg = load_config()
     console.print(
         Panel.fit(
@@ -654,9 +633,10 @@ def cmd_doctor(args, db_path: Path) -> None:
     )
     if len(issues) > 15:
         body += "\n- ..."
-    console.print()
-    console.print(Panel(body, title=title, border_style=border))
-    console.print()
+    with console:
+        console.print()
+        console.print(Panel(body, title=title, border_style=border))
+        console.print()
 
     if not ok and not args.fix:
         raise SystemExit(1)
@@ -708,9 +688,10 @@ def cmd_migrate(args, db_path: Path) -> None:
     body = f"[white]Migrated DB: [bold]{db_path}[/bold]\\nFrom: {from_v} → To: {to_v}[/white]"
     if notes:
         body += "\\n\\n[bold]Notes:[/bold]\\n" + "\\n".join(f"- {n}" for n in notes)
-    console.print()
-    console.print(Panel(body, title="todo migrate", border_style="green"))
-    console.print()
+    with console:
+        console.print()
+        console.print(Panel(body, title="todo migrate", border_style="green"))
+        console.print()
 
 
 def cmd_add(args, db_path: Path) -> None:
@@ -752,6 +733,8 @@ def cmd_today(args, db_path: Path) -> None:
 
 
 def cmd_ls(args, db_path: Path) -> None:
+    from .render import render_tasks_table, render_tasks_plain
+
     _, tasks = load_tasks(db_path)
     if args.done:
         tasks = [t for t in tasks if t.done]
@@ -775,6 +758,8 @@ def cmd_ls(args, db_path: Path) -> None:
 
 def cmd_stats(args, db_path: Path) -> None:
     """Show task statistics as a dashboard (or JSON for scripts)."""
+    from .render import calculate_statistics, render_statistics_dashboard
+
     _, tasks = load_tasks(db_path)
     stats = calculate_statistics(tasks)
     if args.json:
@@ -812,6 +797,7 @@ def cmd_completion(args, _db_path: Path) -> None:
         "archive",
         "clear-done",
         "path",
+        "export",
         "completion",
         "bug",
     ]
@@ -871,6 +857,9 @@ def cmd_done(args, db_path: Path) -> None:
         if args.id is None and not getattr(args, "pick", False):
             args.pick = True
         if args.pick:
+            # prompt_toolkit is heavy; only import it when the picker is used
+            from .ui import pick_tasks_to_done
+
             pending = [t for t in tasks if not t.done]
             chosen = pick_tasks_to_done(pending)
             if not chosen:
@@ -944,7 +933,11 @@ def cmd_edit(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
-        t.text = args.text.strip()
+        text = args.text.strip()
+        if t.text == text:
+            _print_no_change(args.id)
+            return
+        t.text = text
         save_tasks(db_path, next_id, tasks)
     msg = Text()
     msg.append("✏️  Edited ", style="bold cyan")
@@ -969,6 +962,9 @@ def cmd_pri(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
+        if t.priority == p:
+            _print_no_change(args.id)
+            return
         t.priority = p
         save_tasks(db_path, next_id, tasks)
     msg = Text()
@@ -984,14 +980,18 @@ def cmd_due(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
-        if args.date.lower() == "none":
+        due = "" if args.date.lower() == "none" else parse_date(args.date)
+        if t.due == due:
+            _print_no_change(args.id)
+            return
+        if not due:
             t.due = ""
             msg = Text()
             msg.append("📅 Cleared due date for ", style="bold yellow")
             msg.append(f"#{args.id}", style="bold white")
             console.print(msg)
         else:
-            t.due = parse_date(args.date)
+            t.due = due
             msg = Text()
             msg.append("📅 Due date set for ", style="bold cyan")
             msg.append(f"#{args.id}", style="bold white")
@@ -1007,13 +1007,18 @@ def cmd_tag(args, db_path: Path) -> None:
         tags = set(t.tags or [])
         if args.action == "add":
             tags.add(args.tag)
+        else:
+            tags.discard(args.tag)
+        if sorted(tags) == (t.tags or []):
+            _print_no_change(args.id)
+            return
+        if args.action == "add":
             msg = Text()
             msg.append("🏷️  Added tag ", style="bold cyan")
             msg.append(f"#{args.tag}", style="cyan")
             msg.append(f" to #{args.id}", style="white")
             console.print(msg)
         else:
-            tags.discard(args.tag)
             msg = Text()
             msg.append("🏷️  Removed tag ", style="bold yellow")
             msg.append(f"#{args.tag}", style="cyan")
@@ -1091,6 +1096,22 @@ def cmd_path(args, db_path: Path) -> None:
     console.print(msg)
 
 
+def cmd_export(args, db_path: Path) -> None:
+    """Print the DB as indented JSON (the file itself is stored compact)."""
+    from . import jsonio
+
+    payload = jsonio.pretty_dumps(load_db(db_path)) + b"\n"
+    if not args.output:
+        sys.stdout.write(payload.decode("utf-8"))
+        return
+    out = Path(args.output).expanduser()
+    out.write_bytes(payload)
+    msg = Text()
+    msg.append("📤 Exported → ", style="bold cyan")
+    msg.append(str(out), style="bold white")
+    console.print(msg)
+
+
 # ============================================================================
 # Bug Tracking Commands
 # ============================================================================
@@ -1200,6 +1221,9 @@ def cmd_bug_status(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
+        if t.is_bug() and t.bug_status == status:
+            _print_no_change(args.id)
+            return
         if not t.is_bug():
             # Convert to bug if not already
             if not t.tags:
@@ -1228,13 +1252,17 @@ def cmd_bug_assign(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
+        assignee = args.assignee.strip()
+        if t.is_bug() and t.bug_assignee == assignee:
+            _print_no_change(args.id)
+            return
         if not t.is_bug():
             # Convert to bug if not already
             if not t.tags:
                 t.tags = []
             if "bug" not in [tag.lower() for tag in t.tags]:
                 t.tags.append("bug")
-        t.bug_assignee = args.assignee.strip()
+        t.bug_assignee = assignee
         save_tasks(db_path, next_id, tasks)
 
     msg = Text()
@@ -1265,6 +1293,9 @@ def cmd_bug_severity(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
+        if t.is_bug() and t.bug_severity == severity:
+            _print_no_change(args.id)
+            return
         if not t.is_bug():
             # Convert to bug if not already
             if not t.tags:
@@ -1293,14 +1324,17 @@ def cmd_bug_steps(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
+        # Convert literal \n to actual newlines
+        steps = args.steps.strip().replace("\\n", "\n")
+        if t.is_bug() and t.bug_steps == steps:
+            _print_no_change(args.id)
+            return
         if not t.is_bug():
             # Convert to bug if not already
             if not t.tags:
                 t.tags = []
             if "bug" not in [tag.lower() for tag in t.tags]:
                 t.tags.append("bug")
-        # Convert literal \n to actual newlines
-        steps = args.steps.strip().replace("\\n", "\n")
         t.bug_steps = steps
         save_tasks(db_path, next_id, tasks)
 
@@ -1315,13 +1349,17 @@ def cmd_bug_env(args, db_path: Path) -> None:
     with FileLock(db_path.with_suffix(".lock")):
         next_id, tasks = load_tasks(db_path)
         t = find_task(tasks, args.id)
+        env = args.env.strip()
+        if t.is_bug() and t.bug_environment == env:
+            _print_no_change(args.id)
+            return
         if not t.is_bug():
             # Convert to bug if not already
             if not t.tags:
                 t.tags = []
             if "bug" not in [tag.lower() for tag in t.tags]:
                 t.tags.append("bug")
-        t.bug_environment = args.env.strip()
+        t.bug_environment = env
         save_tasks(db_path, next_id, tasks)
 
     msg = Text()
@@ -1332,11 +1370,26 @@ def cmd_bug_env(args, db_path: Path) -> None:
     console.print(msg)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(
-        prog="todo",
-        description="A local TODO CLI with rich tables, interactive picker, stats, backups, and safe archiving.",
-        epilog="""
+# Help epilogs (module-level so build_parser() doesn't rebuild them per call)
+_SETUP_GUIDE = """
+Initialize & DB Setup:
+  todo init                           # create config + DB (if missing)
+  todo init --dir ~/Documents/todo-cli --force
+  todo init --db-path ~/Documents/todo-cli/todos.json --force
+
+Temporary override (no config change):
+  todo --db ./todos.json ls
+  TODO_DB=./todos.json todo ls
+
+Verify which DB is in use:
+  todo config
+  todo path
+
+Precedence:
+  --db > TODO_DB env > config > default
+        """.strip("\n")
+
+_MAIN_EPILOG = """
 Examples:
   # Quick start
   todo add "Fix Celery retries" --p high --due 2025-12-20 --tag backend --tag infra
@@ -1383,29 +1436,9 @@ Interactive Picker Keys:
   Esc   : cancel
 
 For more information, see: README.md, PATH_RESOLUTION.md, and todo-cli/TROUBLESHOOTING.md
-        """,
-        formatter_class=RichHelpFormatter,
-        add_help=False,  # We'll handle help manually
-    )
-    p.add_argument(
-        "--db", type=str, default="", help="DB JSON path (overrides config/env)"
-    )
-    p.add_argument(
-        "--help",
-        "-h",
-        action="help",
-        default=argparse.SUPPRESS,
-        help="Show this help message and exit",
-    )
-    sub = p.add_subparsers(
-        dest="cmd", required=True, title="commands", metavar="COMMAND"
-    )
+        """
 
-    sp = sub.add_parser(
-        "init",
-        help="Initialize config and DB location",
-        description="Initialize the todo-cli configuration and database location.",
-        epilog="""
+_INIT_EPILOG = """
 Examples:
   # Explicit DB file path
   todo init --db-path ~/Documents/mytodos/todos.json
@@ -1415,26 +1448,9 @@ Examples:
 
   # Overwrite existing config
   todo init --dir ~/Documents/mytodos --force
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument(
-        "--db-path", type=str, default="", help="DB JSON file path to store todos"
-    )
-    sp.add_argument(
-        "--dir",
-        type=str,
-        default="",
-        help="Directory to create/use (DB file will be DIR/todos.json)",
-    )
-    sp.add_argument("--force", action="store_true", help="Overwrite existing config")
-    sp.set_defaults(fn=cmd_init)
+        """
 
-    sp = sub.add_parser(
-        "config",
-        help="Show config and resolved DB path",
-        description="Display configuration file location and resolved database path.",
-        epilog="""
+_CONFIG_EPILOG = """
 Examples:
   todo config
 
@@ -1443,16 +1459,9 @@ The resolved DB path follows this precedence:
   2. TODO_DB environment variable
   3. Config file setting
   4. Default: ~/Documents/todo-cli/todos.json
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.set_defaults(fn=cmd_config)
+        """
 
-    sp = sub.add_parser(
-        "doctor",
-        help="Validate/repair the DB JSON",
-        description="Validate your todos DB and optionally repair common issues. Can restore from rotating backups.",
-        epilog=f"""
+_DOCTOR_EPILOG = f"""
 Examples:
   todo doctor
   todo doctor --fix
@@ -1461,51 +1470,21 @@ Examples:
 Backups:
   On every write, todo-cli keeps rotating backups next to your DB:
     {{"db"}}.1 .. {{"db"}}.{BACKUP_KEEP_DEFAULT}
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument(
-        "--fix", action="store_true", help="Attempt to repair issues in-place"
-    )
-    sp.add_argument(
-        "--restore",
-        action="store_true",
-        help=f"Restore from latest backup if JSON is invalid (checks .1..{BACKUP_KEEP_DEFAULT})",
-    )
-    sp.set_defaults(fn=cmd_doctor)
+        """
 
-    sp = sub.add_parser(
-        "migrate",
-        help="Migrate DB schema to latest",
-        description="Migrate your DB JSON schema to the latest supported version (with backups).",
-        epilog="""
+_MIGRATE_EPILOG = """
 Examples:
   todo migrate
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.set_defaults(fn=cmd_migrate)
+        """
 
-    sp = sub.add_parser(
-        "completion",
-        help="Generate shell completion",
-        description="Print a shell completion script to stdout.",
-        epilog="""
+_COMPLETION_EPILOG = """
 Examples:
   todo completion bash > todo.bash
   todo completion zsh  > _todo
   todo completion fish > todo.fish
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument("shell", type=str, choices=["bash", "zsh", "fish"])
-    sp.set_defaults(fn=cmd_completion)
+        """
 
-    sp = sub.add_parser(
-        "add",
-        help="Add a new task",
-        description="Add a new task to your todo list.",
-        epilog="""
+_ADD_EPILOG = """
 Examples:
   todo add "Fix Celery retries"
   todo add "Refactor auth middleware" --p high
@@ -1515,66 +1494,21 @@ Examples:
 
 Priority values: low, med, high
 Date format: YYYY-MM-DD (e.g., 2025-12-20)
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument("text", type=str, help="Task description")
-    sp.add_argument(
-        "--p",
-        type=str,
-        default="",
-        metavar="PRIORITY",
-        help="Priority: low, med, or high",
-    )
-    sp.add_argument(
-        "--due",
-        type=str,
-        default="",
-        metavar="DATE",
-        help="Due date in YYYY-MM-DD format",
-    )
-    sp.add_argument(
-        "--tag",
-        action="append",
-        default=[],
-        metavar="TAG",
-        help="Add a tag (can be used multiple times)",
-    )
-    sp.set_defaults(fn=cmd_add)
+        """
 
-    sp = sub.add_parser(
-        "qa",
-        help="Quick add (text only)",
-        description="Quickly add a task with just text (no flags).",
-        epilog="""
+_QA_EPILOG = """
 Examples:
   todo qa "Review PR"
   todo qa "Ship release notes"
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument("text", type=str, help="Task description")
-    sp.set_defaults(fn=cmd_qa)
+        """
 
-    sp = sub.add_parser(
-        "today",
-        help="Quick add due today",
-        description="Quickly add a task with due date set to today.",
-        epilog="""
+_TODAY_EPILOG = """
 Examples:
   todo today "Pay invoice"
   todo today "Follow up with recruiter"
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument("text", type=str, help="Task description")
-    sp.set_defaults(fn=cmd_today)
+        """
 
-    sp = sub.add_parser(
-        "ls",
-        help="List tasks (table by default)",
-        description="List tasks in a beautiful table format. Shows pending tasks by default.",
-        epilog="""
+_LS_EPILOG = """
 Examples:
   todo ls                    # Show pending tasks
   todo ls --all              # Show all tasks
@@ -1591,62 +1525,15 @@ Sort options: created, due, priority
 
 Due badges:
   OVERDUE, TODAY, IN Nd (plus relative coloring in the table)
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    g = sp.add_mutually_exclusive_group()
-    g.add_argument(
-        "--all", action="store_true", help="Show all tasks (done and pending)"
-    )
-    g.add_argument("--done", action="store_true", help="Show only completed tasks")
-    g.add_argument(
-        "--pending", action="store_true", help="Show only pending tasks (default)"
-    )
-    sp.add_argument(
-        "--tag", type=str, default="", metavar="TAG", help="Filter tasks by tag"
-    )
-    sp.add_argument(
-        "--search",
-        type=str,
-        default="",
-        metavar="TEXT",
-        help="Search for text in task descriptions",
-    )
-    sp.add_argument(
-        "--sort",
-        type=str,
-        default="created",
-        choices=["created", "due", "priority"],
-        help="Sort order (default: created)",
-    )
-    sp.add_argument(
-        "--plain",
-        action="store_true",
-        help="Output in plain text format instead of table",
-    )
-    sp.set_defaults(fn=cmd_ls)
+        """
 
-    sp = sub.add_parser(
-        "stats",
-        help="Show stats dashboard",
-        description="Show task statistics: total, pending, done, high priority, overdue, due today, due soon.",
-        epilog="""
+_STATS_EPILOG = """
 Examples:
   todo stats
   todo stats --json
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument(
-        "--json", action="store_true", help="Print stats as JSON (for scripts)"
-    )
-    sp.set_defaults(fn=cmd_stats)
+        """
 
-    sp = sub.add_parser(
-        "done",
-        help="Mark task(s) as done or undone",
-        description="Mark a task as done by ID, or use interactive picker to select multiple tasks.",
-        epilog="""
+_DONE_EPILOG = """
 Examples:
   todo done                  # Interactive picker (marks selected as done)
   todo done 1                # Mark task #1 as done
@@ -1658,10 +1545,404 @@ Interactive Picker Keys:
   Space : toggle selection
   Enter : confirm
   Esc   : cancel
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument(
+        """
+
+_PICK_EPILOG = """
+Examples:
+  todo pick
+
+Interactive Picker Keys:
+  ↑ / ↓ : move
+  Space : toggle selection
+  Enter : confirm
+  Esc   : cancel
+
+This is equivalent to: todo done --pick
+        """
+
+_RM_EPILOG = """
+Examples:
+  todo rm 1                 # Remove task #1
+  todo rm 5                 # Remove task #5
+
+Note: This permanently deletes the task. Use 'todo done' to mark as done instead.
+        """
+
+_EDIT_EPILOG = """
+Examples:
+  todo edit 1 "Fix Celery retries and add logging"
+  todo edit 3 "Updated: Refactor auth middleware"
+        """
+
+_PRI_EPILOG = """
+Examples:
+  todo pri 1 high           # Set task #1 to high priority
+  todo pri 2 med            # Set task #2 to medium priority
+  todo pri 3 low            # Set task #3 to low priority
+
+Priority values: low, med, high
+        """
+
+_DUE_EPILOG = """
+Examples:
+  todo due 1 2025-12-20     # Set due date for task #1
+  todo due 2 2025-01-15      # Set due date for task #2
+  todo due 3 none            # Clear due date for task #3
+
+Date format: YYYY-MM-DD (e.g., 2025-12-20)
+Use "none" to clear the due date.
+        """
+
+_TAG_EPILOG = """
+Examples:
+  todo tag 1 add backend     # Add 'backend' tag to task #1
+  todo tag 1 add infra        # Add 'infra' tag to task #1
+  todo tag 2 add security    # Add 'security' tag to task #2
+  todo tag 1 del backend      # Remove 'backend' tag from task #1
+
+Use 'todo ls --tag TAG' to filter tasks by tag.
+        """
+
+_ARCHIVE_EPILOG = """
+Examples:
+  todo archive done          # Move all done tasks into todos-archieved.json
+        """
+
+_CLEAR_DONE_EPILOG = """
+Examples:
+  todo clear-done            # Move all completed tasks to todos-archieved.json
+  todo clear-done --force    # Permanently delete done tasks (dangerous)
+        """
+
+_PATH_EPILOG = """
+Examples:
+  todo path                  # Print the resolved DB path
+
+Useful for scripts or to verify which database file is being used.
+        """
+
+_EXPORT_EPILOG = """
+Examples:
+  todo export                    # Print the DB as indented JSON
+  todo export -o backup.json     # Write it to a file
+  todo --db work.json export     # Export another DB
+
+The DB file itself is stored as compact JSON; use this to read or diff it.
+        """
+
+_BUG_EPILOG = """
+Examples:
+  # Create bugs
+  todo bug add "Login button not working" --severity critical --env prod
+  todo bug add "API returns 500" --severity high --assignee john --steps "1. Open app\\n2. Click login"
+
+  # List and filter bugs
+  todo bug list
+  todo bug list --status open --severity critical
+  todo bug list --assignee john --env prod
+
+  # Manage bugs
+  todo bug show 1                    # View detailed bug info
+  todo bug status 1 in-progress      # Update status
+  todo bug assign 1 jane             # Assign to someone
+  todo bug severity 1 high           # Set severity
+  todo bug steps 1 "1. Step\\n2. Step"  # Add reproduction steps
+  todo bug env 1 staging             # Set environment
+
+Bugs are regular tasks with additional fields and automatically tagged with #bug.
+Use 'todo ls --tag bug' to see bugs in regular task lists.
+        """
+
+_BUG_ADD_EPILOG = """
+Examples:
+  # Basic bug
+  todo bug add "Login button not working"
+
+  # Bug with severity and environment
+  todo bug add "API returns 500" --severity critical --env prod --assignee john
+
+  # Complete bug with all fields
+  todo bug add "UI glitch" --severity medium --status in-progress \\
+    --steps "1. Open app\\n2. Click button\\n3. See error" \\
+    --assignee jane --env staging --p high --due 2025-12-25
+
+  # Quick bug for QA
+  todo bug add "Payment fails on Safari" --severity high --env staging
+        """
+
+_BUG_LIST_EPILOG = """
+Examples:
+  # List all bugs
+  todo bug list
+
+  # Filter by status
+  todo bug list --status open
+  todo bug list --status in-progress
+  todo bug list --status fixed
+
+  # Filter by severity
+  todo bug list --severity critical
+  todo bug list --severity high
+
+  # Filter by assignee or environment
+  todo bug list --assignee john
+  todo bug list --env prod
+
+  # Combine multiple filters (all must match)
+  todo bug list --status open --severity critical --env prod
+  todo bug list --status open --assignee john
+        """
+
+_BUG_SHOW_EPILOG = """
+Examples:
+  # Show detailed bug information
+  todo bug show 1
+
+Displays all bug fields including status, severity, assignee, environment,
+steps to reproduce, priority, due date, tags, and timestamps.
+        """
+
+_BUG_STATUS_EPILOG = """
+Examples:
+  todo bug status 1 open
+  todo bug status 1 in-progress
+  todo bug status 1 fixed
+  todo bug status 1 closed
+        """
+
+_BUG_ASSIGN_EPILOG = """
+Examples:
+  # Assign bug to someone
+  todo bug assign 1 john
+  todo bug assign 2 "Jane Doe"
+  todo bug assign 3 backend-team
+
+The assignee can be a name, username, or team identifier.
+        """
+
+_BUG_SEVERITY_EPILOG = """
+Examples:
+  todo bug severity 1 critical
+  todo bug severity 1 high
+  todo bug severity 1 medium
+  todo bug severity 1 low
+        """
+
+_BUG_STEPS_EPILOG = """
+Examples:
+  # Add steps to reproduce (use \\n for line breaks)
+  todo bug steps 1 "1. Open the app\\n2. Click login\\n3. See error"
+
+  # Multi-line steps example
+  todo bug steps 1 "1. Navigate to checkout page\\n2. Select payment method\\n3. Enter card details\\n4. Click pay button\\n5. Observe: Payment fails with error message"
+
+Use \\n to create line breaks in the steps. The steps will be displayed
+formatted when viewing the bug with 'todo bug show'.
+        """
+
+_BUG_ENV_EPILOG = """
+Examples:
+  todo bug env 1 prod
+  todo bug env 1 staging
+  todo bug env 1 dev
+        """
+
+
+def _build_init_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "init",
+        help="Initialize config and DB location",
+        description="Initialize the todo-cli configuration and database location.",
+        epilog=_INIT_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument(
+        "--db-path", type=str, default="", help="DB JSON file path to store todos"
+    )
+    sp.add_argument(
+        "--dir",
+        type=str,
+        default="",
+        help="Directory to create/use (DB file will be DIR/todos.json)",
+    )
+    sp.add_argument("--force", action="store_true", help="Overwrite existing config")
+    sp.set_defaults(fn=cmd_init)
+
+
+def _build_config_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "config",
+        help="Show config and resolved DB path",
+        description="Display configuration file location and resolved database path.",
+        epilog=_CONFIG_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.set_defaults(fn=cmd_config)
+
+
+def _build_doctor_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "doctor",
+        help="Validate/repair the DB JSON",
+        description="Validate your todos DB and optionally repair common issues. Can restore from rotating backups.",
+        epilog=_DOCTOR_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument(
+        "--fix", action="store_true", help="Attempt to repair issues in-place"
+    )
+    sp.add_argument(
+        "--restore",
+        action="store_true",
+        help=f"Restore from latest backup if JSON is invalid (checks .1..{BACKUP_KEEP_DEFAULT})",
+    )
+    sp.set_defaults(fn=cmd_doctor)
+
+
+def _build_migrate_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "migrate",
+        help="Migrate DB schema to latest",
+        description="Migrate your DB JSON schema to the latest supported version (with backups).",
+        epilog=_MIGRATE_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.set_defaults(fn=cmd_migrate)
+
+
+def _build_completion_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "completion",
+        help="Generate shell completion",
+        description="Print a shell completion script to stdout.",
+        epilog=_COMPLETION_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument("shell", type=str, choices=["bash", "zsh", "fish"])
+    sp.set_defaults(fn=cmd_completion)
+
+
+def _build_add_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "add",
+        help="Add a new task",
+        description="Add a new task to your todo list.",
+        epilog=_ADD_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument("text", type=str, help="Task description")
+    sp.add_argument(
+        "--p",
+        type=str,
+        default="",
+        metavar="PRIORITY",
+        help="Priority: low, med, or high",
+    )
+    sp.add_argument(
+        "--due",
+        type=str,
+        default="",
+        metavar="DATE",
+        help="Due date in YYYY-MM-DD format",
+    )
+    sp.add_argument(
+        "--tag",
+        action="append",
+        default=[],
+        metavar="TAG",
+        help="Add a tag (can be used multiple times)",
+    )
+    sp.set_defaults(fn=cmd_add)
+
+
+def _build_qa_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "qa",
+        help="Quick add (text only)",
+        description="Quickly add a task with just text (no flags).",
+        epilog=_QA_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument("text", type=str, help="Task description")
+    sp.set_defaults(fn=cmd_qa)
+
+
+def _build_today_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "today",
+        help="Quick add due today",
+        description="Quickly add a task with due date set to today.",
+        epilog=_TODAY_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument("text", type=str, help="Task description")
+    sp.set_defaults(fn=cmd_today)
+
+
+def _build_ls_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "ls",
+        help="List tasks (table by default)",
+        description="List tasks in a beautiful table format. Shows pending tasks by default.",
+        epilog=_LS_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    g = sp.add_mutually_exclusive_group()
+    g.add_argument(
+        "--all", action="store_true", help="Show all tasks (done and pending)"
+    )
+    g.add_argument("--done", action="store_true", help="Show only completed tasks")
+    g.add_argument(
+        "--pending", action="store_true", help="Show only pending tasks (default)"
+    )
+    sp.add_argument(
+        "--tag", type=str, default="", metavar="TAG", help="Filter tasks by tag"
+    )
+    sp.add_argument(
+        "--search",
+        type=str,
+        default="",
+        metavar="TEXT",
+        help="Search for text in task descriptions",
+    )
+    sp.add_argument(
+        "--sort",
+        type=str,
+        default="created",
+        choices=["created", "due", "priority"],
+        help="Sort order (default: created)",
+    )
+    sp.add_argument(
+        "--plain",
+        action="store_true",
+        help="Output in plain text format instead of table",
+    )
+    sp.set_defaults(fn=cmd_ls)
+
+
+def _build_stats_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "stats",
+        help="Show stats dashboard",
+        description="Show task statistics: total, pending, done, high priority, overdue, due today, due soon.",
+        epilog=_STATS_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument(
+        "--json", action="store_true", help="Print stats as JSON (for scripts)"
+    )
+    sp.set_defaults(fn=cmd_stats)
+
+
+def _build_done_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "done",
+        help="Mark task(s) as done or undone",
+        description="Mark a task as done by ID, or use interactive picker to select multiple tasks.",
+        epilog=_DONE_EPILOG,
+        formatter_class=RichHelpFormatter,
+    )
+    sp.add_argument(
         "id",
         type=int,
         nargs="?",
@@ -1675,69 +1956,49 @@ Interactive Picker Keys:
     )
     sp.set_defaults(fn=cmd_done)
 
+
+def _build_pick_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "pick",
         help="Interactive picker to mark tasks as done",
         description="Open an interactive picker dialog to select and mark multiple tasks as done.",
-        epilog="""
-Examples:
-  todo pick
-
-Interactive Picker Keys:
-  ↑ / ↓ : move
-  Space : toggle selection
-  Enter : confirm
-  Esc   : cancel
-
-This is equivalent to: todo done --pick
-        """,
+        epilog=_PICK_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.set_defaults(fn=cmd_pick)
 
+
+def _build_rm_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "rm",
         help="Remove a task",
         description="Permanently delete a task from your todo list.",
-        epilog="""
-Examples:
-  todo rm 1                 # Remove task #1
-  todo rm 5                 # Remove task #5
-
-Note: This permanently deletes the task. Use 'todo done' to mark as done instead.
-        """,
+        epilog=_RM_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument("id", type=int, metavar="ID", help="Task ID to remove")
     sp.set_defaults(fn=cmd_rm)
 
+
+def _build_edit_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "edit",
         help="Edit task description",
         description="Update the text description of a task.",
-        epilog="""
-Examples:
-  todo edit 1 "Fix Celery retries and add logging"
-  todo edit 3 "Updated: Refactor auth middleware"
-        """,
+        epilog=_EDIT_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument("id", type=int, metavar="ID", help="Task ID to edit")
     sp.add_argument("text", type=str, metavar="TEXT", help="New task description")
     sp.set_defaults(fn=cmd_edit)
 
+
+def _build_pri_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "pri",
         help="Set task priority",
         description="Set or update the priority level of a task.",
-        epilog="""
-Examples:
-  todo pri 1 high           # Set task #1 to high priority
-  todo pri 2 med            # Set task #2 to medium priority
-  todo pri 3 low            # Set task #3 to low priority
-
-Priority values: low, med, high
-        """,
+        epilog=_PRI_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument("id", type=int, metavar="ID", help="Task ID")
@@ -1750,19 +2011,13 @@ Priority values: low, med, high
     )
     sp.set_defaults(fn=cmd_pri)
 
+
+def _build_due_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "due",
         help="Set or clear due date",
         description="Set or clear the due date for a task.",
-        epilog="""
-Examples:
-  todo due 1 2025-12-20     # Set due date for task #1
-  todo due 2 2025-01-15      # Set due date for task #2
-  todo due 3 none            # Clear due date for task #3
-
-Date format: YYYY-MM-DD (e.g., 2025-12-20)
-Use "none" to clear the due date.
-        """,
+        epilog=_DUE_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument("id", type=int, metavar="ID", help="Task ID")
@@ -1774,19 +2029,13 @@ Use "none" to clear the due date.
     )
     sp.set_defaults(fn=cmd_due)
 
+
+def _build_tag_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "tag",
         help="Add or remove a tag from a task",
         description="Add or remove tags to organize and filter your tasks.",
-        epilog="""
-Examples:
-  todo tag 1 add backend     # Add 'backend' tag to task #1
-  todo tag 1 add infra        # Add 'infra' tag to task #1
-  todo tag 2 add security    # Add 'security' tag to task #2
-  todo tag 1 del backend      # Remove 'backend' tag from task #1
-
-Use 'todo ls --tag TAG' to filter tasks by tag.
-        """,
+        epilog=_TAG_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument("id", type=int, metavar="ID", help="Task ID")
@@ -1800,14 +2049,13 @@ Use 'todo ls --tag TAG' to filter tasks by tag.
     sp.add_argument("tag", type=str, metavar="TAG", help="Tag name")
     sp.set_defaults(fn=cmd_tag)
 
+
+def _build_archive_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "archive",
         help="Archive tasks (move out of main DB)",
         description="Move tasks from the main DB into todos-archieved.json (same folder as your todos DB).",
-        epilog="""
-Examples:
-  todo archive done          # Move all done tasks into todos-archieved.json
-        """,
+        epilog=_ARCHIVE_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument(
@@ -1820,15 +2068,13 @@ Examples:
     )
     sp.set_defaults(fn=cmd_archive)
 
+
+def _build_clear_done_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "clear-done",
         help="Clear completed tasks (archives by default)",
         description="Remove done tasks from the active list. By default, tasks are moved to todos-archieved.json (safer).",
-        epilog="""
-Examples:
-  todo clear-done            # Move all completed tasks to todos-archieved.json
-  todo clear-done --force    # Permanently delete done tasks (dangerous)
-        """,
+        epilog=_CLEAR_DONE_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument(
@@ -1838,86 +2084,55 @@ Examples:
     )
     sp.set_defaults(fn=cmd_clear_done)
 
+
+def _build_path_parser(sub: argparse._SubParsersAction) -> None:
     sp = sub.add_parser(
         "path",
         help="Print resolved database path",
         description="Display the resolved database file path based on current configuration.",
-        epilog="""
-Examples:
-  todo path                  # Print the resolved DB path
-
-Useful for scripts or to verify which database file is being used.
-        """,
+        epilog=_PATH_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.set_defaults(fn=cmd_path)
 
-    # Bug tracking subcommands
-    bug_sub = sub.add_parser(
-        "bug",
-        help="Bug tracking commands",
-        description="Track bugs with status, severity, assignee, steps to reproduce, and environment.",
-        epilog="""
-Examples:
-  # Create bugs
-  todo bug add "Login button not working" --severity critical --env prod
-  todo bug add "API returns 500" --severity high --assignee john --steps "1. Open app\\n2. Click login"
-
-  # List and filter bugs
-  todo bug list
-  todo bug list --status open --severity critical
-  todo bug list --assignee john --env prod
-
-  # Manage bugs
-  todo bug show 1                    # View detailed bug info
-  todo bug status 1 in-progress      # Update status
-  todo bug assign 1 jane             # Assign to someone
-  todo bug severity 1 high           # Set severity
-  todo bug steps 1 "1. Step\\n2. Step"  # Add reproduction steps
-  todo bug env 1 staging             # Set environment
 
-Bugs are regular tasks with additional fields and automatically tagged with #bug.
-Use 'todo ls --tag bug' to see bugs in regular task lists.
-        """,
+def _build_export_parser(sub: argparse._SubParsersAction) -> None:
+    sp = sub.add_parser(
+        "export",
+        help="Print the DB as pretty JSON",
+        description="Print the database as indented JSON, or write it to a file.",
+        epilog=_EXPORT_EPILOG,
         formatter_class=RichHelpFormatter,
     )
-    bug_cmds = bug_sub.add_subparsers(
-        dest="bug_cmd", required=True, title="bug commands", metavar="COMMAND"
+    sp.add_argument(
+        "--output", "-o", type=str, default="", help="Write to this file instead of stdout"
     )
+    sp.set_defaults(fn=cmd_export)
 
+
+_BUG_STATUSES = ["open", "in-progress", "fixed", "closed"]
+_BUG_SEVERITIES = ["critical", "high", "medium", "low"]
+
+
+def _build_bug_add_parser(bug_cmds: argparse._SubParsersAction) -> None:
     sp = bug_cmds.add_parser(
         "add",
         help="Add a new bug report",
         description="Create a new bug report with optional fields.",
-        epilog="""
-Examples:
-  # Basic bug
-  todo bug add "Login button not working"
-
-  # Bug with severity and environment
-  todo bug add "API returns 500" --severity critical --env prod --assignee john
-
-  # Complete bug with all fields
-  todo bug add "UI glitch" --severity medium --status in-progress \\
-    --steps "1. Open app\\n2. Click button\\n3. See error" \\
-    --assignee jane --env staging --p high --due 2025-12-25
-
-  # Quick bug for QA
-  todo bug add "Payment fails on Safari" --severity high --env staging
-        """,
+        epilog=_BUG_ADD_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument("text", type=str, help="Bug description")
     sp.add_argument(
         "--severity",
         type=str,
-        choices=["critical", "high", "medium", "low"],
+        choices=_BUG_SEVERITIES,
         help="Bug severity",
     )
     sp.add_argument(
         "--status",
         type=str,
-        choices=["open", "in-progress", "fixed", "closed"],
+        choices=_BUG_STATUSES,
         default="open",
         help="Bug status (default: open)",
     )
@@ -1949,241 +2164,287 @@ Examples:
     )
     sp.set_defaults(fn=cmd_bug_add)
 
+
+def _build_bug_list_parser(bug_cmds: argparse._SubParsersAction) -> None:
     sp = bug_cmds.add_parser(
         "list",
         help="List all bugs",
         description="List all bugs with filtering options.",
-        epilog="""
-Examples:
-  # List all bugs
-  todo bug list
-
-  # Filter by status
-  todo bug list --status open
-  todo bug list --status in-progress
-  todo bug list --status fixed
-
-  # Filter by severity
-  todo bug list --severity critical
-  todo bug list --severity high
-
-  # Filter by assignee or environment
-  todo bug list --assignee john
-  todo bug list --env prod
-
-  # Combine multiple filters (all must match)
-  todo bug list --status open --severity critical --env prod
-  todo bug list --status open --assignee john
-        """,
+        epilog=_BUG_LIST_EPILOG,
         formatter_class=RichHelpFormatter,
     )
     sp.add_argument(
         "--status",
         type=str,
-        choices=["open", "in-progress", "fixed", "closed"],
+        choices=_BUG_STATUSES,
         help="Filter by status",
     )
     sp.add_argument(
         "--severity",
         type=str,
-        choices=["critical", "high", "medium", "low"],
+        choices=_BUG_SEVERITIES,
         help="Filter by severity",
     )
     sp.add_argument("--assignee", type=str, help="Filter by assignee")
     sp.add_argument("--env", type=str, help="Filter by environment")
     sp.set_defaults(fn=cmd_bug_list)
 
-    sp = bug_cmds.add_parser(
+
+# Bug subcommands of the form `todo bug NAME ID [VALUE]`:
+# (name, help, description, epilog, VALUE argument as (dest, kwargs) or None, handler)
+_BUG_ID_COMMANDS = (
+    (
         "show",
-        help="Show detailed bug information",
-        description="Display detailed information about a specific bug.",
-        epilog="""
-Examples:
-  # Show detailed bug information
-  todo bug show 1
+        "Show detailed bug information",
+        "Display detailed information about a specific bug.",
+        _BUG_SHOW_EPILOG,
+        None,
+        cmd_bug_show,
+    ),
+    (
+        "status",
+        "Set bug status",
+        "Update the status of a bug.",
+        _BUG_STATUS_EPILOG,
+        ("status", {"type": str, "choices": _BUG_STATUSES, "help": "New status"}),
+        cmd_bug_status,
+    ),
+    (
+        "assign",
+        "Assign bug to someone",
+        "Assign a bug to a team member.",
+        _BUG_ASSIGN_EPILOG,
+        ("assignee", {"type": str, "help": "Assignee name"}),
+        cmd_bug_assign,
+    ),
+    (
+        "severity",
+        "Set bug severity",
+        "Set the severity level of a bug.",
+        _BUG_SEVERITY_EPILOG,
+        ("severity", {"type": str, "choices": _BUG_SEVERITIES, "help": "Severity level"}),
+        cmd_bug_severity,
+    ),
+    (
+        "steps",
+        "Set steps to reproduce",
+        "Add or update steps to reproduce a bug.",
+        _BUG_STEPS_EPILOG,
+        ("steps", {"type": str, "help": "Steps to reproduce"}),
+        cmd_bug_steps,
+    ),
+    (
+        "env",
+        "Set bug environment",
+        "Set the environment where the bug occurs.",
+        _BUG_ENV_EPILOG,
+        ("env", {"type": str, "help": "Environment name"}),
+        cmd_bug_env,
+    ),
+)
 
-Displays all bug fields including status, severity, assignee, environment,
-steps to reproduce, priority, due date, tags, and timestamps.
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument("id", type=int, metavar="ID", help="Bug ID")
-    sp.set_defaults(fn=cmd_bug_show)
+_BUG_SUBCOMMANDS = ("add", "list") + tuple(row[0] for row in _BUG_ID_COMMANDS)
 
-    sp = bug_cmds.add_parser(
-        "status",
-        help="Set bug status",
-        description="Update the status of a bug.",
-        epilog="""
-Examples:
-  todo bug status 1 open
-  todo bug status 1 in-progress
-  todo bug status 1 fixed
-  todo bug status 1 closed
-        """,
-        formatter_class=RichHelpFormatter,
-    )
-    sp.add_argument("id", type=int, metavar="ID", help="Bug ID")
-    sp.add_argument(
-        "status",
-        type=str,
-        choices=["open", "in-progress", "fixed", "closed"],
-        help="New status",
-    )
-    sp.set_defaults(fn=cmd_bug_status)
 
-    sp = bug_cmds.add_parser(
-        "assign",
-        help="Assign bug to someone",
-        description="Assign a bug to a team member.",
-        epilog="""
-Examples:
-  # Assign bug to someone
-  todo bug assign 1 john
-  todo bug assign 2 "Jane Doe"
-  todo bug assign 3 backend-team
+def _build_bug_parser(
+    sub: argparse._SubParsersAction, bug_cmd: Optional[str] = None
+) -> None:
+    """Register `todo bug`; with a known `bug_cmd`, only that bug subcommand is built."""
+    if bug_cmd not in _BUG_SUBCOMMANDS:
+        bug_cmd = None
 
-The assignee can be a name, username, or team identifier.
-        """,
+    bug_sub = sub.add_parser(
+        "bug",
+        help="Bug tracking commands",
+        description="Track bugs with status, severity, assignee, steps to reproduce, and environment.",
+        epilog=_BUG_EPILOG,
         formatter_class=RichHelpFormatter,
     )
-    sp.add_argument("id", type=int, metavar="ID", help="Bug ID")
-    sp.add_argument("assignee", type=str, help="Assignee name")
-    sp.set_defaults(fn=cmd_bug_assign)
+    bug_cmds = bug_sub.add_subparsers(
+        dest="bug_cmd", required=True, title="bug commands", metavar="COMMAND"
+    )
 
-    sp = bug_cmds.add_parser(
-        "severity",
-        help="Set bug severity",
-        description="Set the severity level of a bug.",
-        epilog="""
-Examples:
-  todo bug severity 1 critical
-  todo bug severity 1 high
-  todo bug severity 1 medium
-  todo bug severity 1 low
-        """,
+    if bug_cmd in (None, "add"):
+        _build_bug_add_parser(bug_cmds)
+    if bug_cmd in (None, "list"):
+        _build_bug_list_parser(bug_cmds)
+    for name, help_, description, epilog, value_arg, fn in _BUG_ID_COMMANDS:
+        if bug_cmd is not None and name != bug_cmd:
+            continue
+        sp = bug_cmds.add_parser(
+            name,
+            help=help_,
+            description=description,
+            epilog=epilog,
+            formatter_class=RichHelpFormatter,
+        )
+        sp.add_argument("id", type=int, metavar="ID", help="Bug ID")
+        if value_arg is not None:
+            dest, kwargs = value_arg
+            sp.add_argument(dest, **kwargs)
+        sp.set_defaults(fn=fn)
+
+
+# Subcommand name -> builder. run() only builds the one being invoked.
+_SUBCOMMAND_BUILDERS = {
+    "init": _build_init_parser,
+    "config": _build_config_parser,
+    "doctor": _build_doctor_parser,
+    "migrate": _build_migrate_parser,
+    "completion": _build_completion_parser,
+    "add": _build_add_parser,
+    "qa": _build_qa_parser,
+    "today": _build_today_parser,
+    "ls": _build_ls_parser,
+    "stats": _build_stats_parser,
+    "done": _build_done_parser,
+    "pick": _build_pick_parser,
+    "rm": _build_rm_parser,
+    "edit": _build_edit_parser,
+    "pri": _build_pri_parser,
+    "due": _build_due_parser,
+    "tag": _build_tag_parser,
+    "archive": _build_archive_parser,
+    "clear-done": _build_clear_done_parser,
+    "path": _build_path_parser,
+    "export": _build_export_parser,
+    "bug": _build_bug_parser,
+}
+
+
+def build_parser(
+    cmd: Optional[str] = None, subcmd: Optional[str] = None
+) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+
+    With `cmd`, only that subcommand is registered (enough to parse/print help
+    for it); otherwise every subcommand is built. `subcmd` narrows commands
+    that have their own subcommands (`bug`) the same way.
+    """
+    p = argparse.ArgumentParser(
+        prog="todo",
+        description="A local TODO CLI with rich tables, interactive picker, stats, backups, and safe archiving.",
+        epilog=_MAIN_EPILOG,
         formatter_class=RichHelpFormatter,
+        add_help=False,  # We'll handle help manually
     )
-    sp.add_argument("id", type=int, metavar="ID", help="Bug ID")
-    sp.add_argument(
-        "severity",
-        type=str,
-        choices=["critical", "high", "medium", "low"],
-        help="Severity level",
+    p.add_argument(
+        "--db", type=str, default="", help="DB JSON path (overrides config/env)"
     )
-    sp.set_defaults(fn=cmd_bug_severity)
-
-    sp = bug_cmds.add_parser(
-        "steps",
-        help="Set steps to reproduce",
-        description="Add or update steps to reproduce a bug.",
-        epilog="""
-Examples:
-  # Add steps to reproduce (use \\n for line breaks)
-  todo bug steps 1 "1. Open the app\\n2. Click login\\n3. See error"
-
-  # Multi-line steps example
-  todo bug steps 1 "1. Navigate to checkout page\\n2. Select payment method\\n3. Enter card details\\n4. Click pay button\\n5. Observe: Payment fails with error message"
-
-Use \\n to create line breaks in the steps. The steps will be displayed
-formatted when viewing the bug with 'todo bug show'.
-        """,
-        formatter_class=RichHelpFormatter,
+    p.add_argument(
+        "--help",
+        "-h",
+        action="help",
+        default=argparse.SUPPRESS,
+        help="Show this help message and exit",
     )
-    sp.add_argument("id", type=int, metavar="ID", help="Bug ID")
-    sp.add_argument("steps", type=str, help="Steps to reproduce")
-    sp.set_defaults(fn=cmd_bug_steps)
-
-    sp = bug_cmds.add_parser(
-        "env",
-        help="Set bug environment",
-        description="Set the environment where the bug occurs.",
-        epilog="""
-Examples:
-  todo bug env 1 prod
-  todo bug env 1 staging
-  todo bug env 1 dev
-        """,
-        formatter_class=RichHelpFormatter,
+    sub = p.add_subparsers(
+        dest="cmd", required=True, title="commands", metavar="COMMAND"
     )
-    sp.add_argument("id", type=int, metavar="ID", help="Bug ID")
-    sp.add_argument("env", type=str, help="Environment name")
-    sp.set_defaults(fn=cmd_bug_env)
-
+    for name, builder in _SUBCOMMAND_BUILDERS.items():
+        if cmd is None or name == cmd:
+            if name == "bug":
+                builder(sub, subcmd)
+            else:
+                builder(sub)
+    # Keep a handle on the subparsers action so callers don't scan p._actions.
+    p._todo_subparsers = sub
     return p
 
 
-def run(argv: List[str]) -> int:
-    parser = build_parser()
+def _positionals(argv: List[str]) -> Iterator[str]:
+    """Yield argv's positional tokens (skipping options and --db's value)."""
+    it = iter(argv)
+    for a in it:
+        if a == "--db":
+            next(it, None)  # skip the option's value
+            continue
+        if a.startswith("-"):
+            continue
+        yield a
 
+
+def run(argv: List[str]) -> int:
     # Check for help flags before parsing
     if "--help" in argv or "-h" in argv:
         help_idx = argv.index("--help") if "--help" in argv else argv.index("-h")
         subcommand = None
 
-        # Check if there's a command before --help
-        if help_idx > 0:
-            potential_cmd = argv[help_idx - 1]
-            # Check if it's a valid subcommand
-            for action in parser._actions:
-                if isinstance(action, argparse._SubParsersAction):
-                    if potential_cmd in action.choices:
-                        subcommand = potential_cmd
-                        break
-
-        # Print appropriate help
-        if subcommand:
-            for action in parser._actions:
-                if isinstance(action, argparse._SubParsersAction):
-                    if subcommand in action.choices:
-                        _print_rich_help(action.choices[subcommand], subcommand)
-                        return 0
-        else:
-            _print_rich_help(parser)
-            return 0
+        # Main help lists every command; subcommand help only needs its own parser.
+        potential_cmd = argv[help_idx - 1] if help_idx > 0 else None
+        parser = build_parser(
+            potential_cmd if potential_cmd in _SUBCOMMAND_BUILDERS else None
+        )
+
+        # Check if there's a valid subcommand before --help
+        choices = parser._todo_subparsers.choices
+        if potential_cmd is not None and potential_cmd in choices:
+            subcommand = potential_cmd
+
+        # Print appropriate help. Help is a few dozen console.print() calls;
+        # the console's buffer context turns them into a single write.
+        with console:
+            if subcommand:
+                _print_rich_help(choices[subcommand], subcommand)
+            else:
+                _print_rich_help(parser)
+        return 0
+
+    # Only build the invoked subcommand; unknown/missing commands get the full
+    # parser so argparse reports the usual "invalid choice" errors.
+    positionals = _positionals(argv)
+    cmd = next(positionals, None)
+    if cmd in _SUBCOMMAND_BUILDERS:
+        parser = build_parser(cmd, next(positionals, None))
+    else:
+        parser = build_parser()
 
     try:
         args = parser.parse_args(argv)
     except SystemExit as e:
         # Handle argument errors with Rich
         if e.code == 2:  # argparse error
+            with console:
+                console.print()
+                console.print(
+                    Panel(
+                        "[bold red]❌ Invalid arguments[/bold red]\n\n"
+                        "[white]Use [bold cyan]todo --help[/bold cyan] for usage information.\n"
+                        "Or [bold cyan]todo COMMAND --help[/bold cyan] for command-specific help.[/white]",
+                        border_style="red",
+                    )
+                )
+                console.print()
+        raise
+
+    db_path = resolve_db_path(args.db)
+    if args.cmd == "done" and args.id is None and getattr(args, "undo", False):
+        with console:
             console.print()
             console.print(
                 Panel(
-                    "[bold red]❌ Invalid arguments[/bold red]\n\n"
-                    "[white]Use [bold cyan]todo --help[/bold cyan] for usage information.\n"
-                    "Or [bold cyan]todo COMMAND --help[/bold cyan] for command-specific help.[/white]",
+                    "[bold red]❌ Error[/bold red]\n\n"
+                    "[white]todo done --undo requires an ID[/white]",
                     border_style="red",
                 )
             )
             console.print()
-        raise
-
-    db_path = resolve_db_path(args.db)
-    if args.cmd == "done" and args.id is None and getattr(args, "undo", False):
-        console.print()
-        console.print(
-            Panel(
-                "[bold red]❌ Error[/bold red]\n\n"
-                "[white]todo done --undo requires an ID[/white]",
-                border_style="red",
-            )
-        )
-        console.print()
         raise SystemExit(1)
 
     # Call the command function (works for both top-level and nested bug commands)
     if hasattr(args, "fn"):
         args.fn(args, db_path)
     else:
-        console.print()
-        console.print(
-            Panel(
-                "[bold red]❌ Command not found[/bold red]\n\n"
-                "[white]Use [bold cyan]todo --help[/bold cyan] for available commands.[/white]",
-                border_style="red",
+        with console:
+            console.print()
+            console.print(
+                Panel(
+                    "[bold red]❌ Command not found[/bold red]\n\n"
+                    "[white]Use [bold cyan]todo --help[/bold cyan] for available commands.[/white]",
+                    border_style="red",
+                )
             )
-        )
-        console.print()
+            console.print()
         raise SystemExit(1)
     return 0
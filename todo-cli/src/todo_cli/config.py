@@ -1,8 +1,9 @@
 from __future__ import annotations
 import os
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
+from . import jsonio
 from .paths import config_path, install_config_path
 
 # Config schema:
@@ -16,6 +17,10 @@ from .paths import config_path, install_config_path
 #   }
 SCHEMA_VERSION = 2
 
+# Single-entry cache for load_config_with_base_dir(), keyed on both config paths
+# and their stat signatures so edits (or a different HOME) are picked up.
+_config_cache: tuple | None = None
+
 
 @dataclass
 class AppConfig:
@@ -25,13 +30,15 @@ class AppConfig:
     updated_at: str = ""
 
 
+@lru_cache(maxsize=None)
 def install_id() -> str:
     """
     Identifier for "where todo is installed" so separate installs don't stomp each
     other's config.
 
     We use the resolved package directory path, which is unique per editable
-    install / venv / site-packages location.
+    install / venv / site-packages location. It can't change within a process,
+    so it's computed once (Path.resolve() walks symlinks on the filesystem).
     """
     p = Path(__file__).resolve().parent  # .../todo_cli
     s = str(p)
@@ -41,8 +48,16 @@ def install_id() -> str:
     return s
 
 
+# Directories this process already created/verified; saves a mkdir per write.
+_ensured_dirs: set = set()
+
+
 def _ensure_parent(p: Path) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
+    d = p.parent
+    if d in _ensured_dirs:
+        return
+    d.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(d)
 
 
 def _coerce_cfg(data: dict) -> AppConfig:
@@ -56,14 +71,25 @@ def _coerce_cfg(data: dict) -> AppConfig:
 
 def _read_json(p: Path) -> dict | None:
     try:
-        if not p.exists():
-            return None
-        raw = json.loads(p.read_text(encoding="utf-8"))
+        raw = jsonio.loads(p.read_bytes())  # a missing file raises and yields None
         return raw if isinstance(raw, dict) else None
     except Exception:
         return None
 
 
+def _file_sig(p: Path) -> tuple | None:
+    try:
+        st = os.stat(p)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _clear_config_cache() -> None:
+    global _config_cache
+    _config_cache = None
+
+
 def load_config_with_base_dir() -> tuple[AppConfig, Path]:
     """
     Load config with knowledge of the directory to resolve relative db_path.
@@ -71,8 +97,22 @@ def load_config_with_base_dir() -> tuple[AppConfig, Path]:
     Priority:
     1) install_config_path() (per-install, local)
     2) config_path() (global per-user file, v2 installs map or legacy v1)
+
+    The parsed result is cached until either config file changes on disk.
     """
+    global _config_cache
     install_p = install_config_path()
+    global_p = config_path()
+    key = (install_p, _file_sig(install_p), global_p, _file_sig(global_p))
+    if _config_cache is not None and _config_cache[0] == key:
+        cfg, base_dir = _config_cache[1]
+        return replace(cfg), base_dir
+    cfg, base_dir = _load_config_uncached(install_p, global_p)
+    _config_cache = (key, (replace(cfg), base_dir))
+    return cfg, base_dir
+
+
+def _load_config_uncached(install_p: Path, global_p: Path) -> tuple[AppConfig, Path]:
     install_data = _read_json(install_p)
     if install_data is not None:
         # install-config can be either:
@@ -89,7 +129,6 @@ def load_config_with_base_dir() -> tuple[AppConfig, Path]:
             pass
         return _coerce_cfg(install_data), install_p.parent
 
-    global_p = config_path()
     data = _read_json(global_p)
     if data is None:
         return AppConfig(), global_p.parent
@@ -118,24 +157,21 @@ def load_config() -> AppConfig:
 def save_install_config(cfg: AppConfig) -> bool:
     """
     Best-effort write of per-install config at install_config_path().
-    Returns True if write succeeds.
+    Returns True if write succeeds (or the file already has this content).
     """
     p = install_config_path()
+    payload = {
+        "db_path": cfg.db_path,
+        "backups_dir": cfg.backups_dir,
+        "created_at": cfg.created_at,
+        "updated_at": cfg.updated_at,
+    }
+    if _read_json(p) == payload:
+        return True
+    _clear_config_cache()
     try:
         _ensure_parent(p)
-        p.write_text(
-            json.dumps(
-                {
-                    "db_path": cfg.db_path,
-                    "backups_dir": cfg.backups_dir,
-                    "created_at": cfg.created_at,
-                    "updated_at": cfg.updated_at,
-                },
-                indent=2,
-                ensure_ascii=False,
-            ),
-            encoding="utf-8",
-        )
+        p.write_bytes(jsonio.pretty_dumps(payload))
         return True
     except Exception:
         return False
@@ -143,13 +179,12 @@ def save_install_config(cfg: AppConfig) -> bool:
 
 def save_config(cfg: AppConfig) -> None:
     p = config_path()
-    _ensure_parent(p)
 
     # Merge with existing file (preserve other installs)
     base: dict = {}
     if p.exists():
         try:
-            base = json.loads(p.read_text(encoding="utf-8"))
+            base = jsonio.loads(p.read_bytes())
         except Exception:
             base = {}
     if not isinstance(base, dict):
@@ -159,19 +194,25 @@ def save_config(cfg: AppConfig) -> None:
     if not isinstance(installs, dict):
         installs = {}
 
-    installs[install_id()] = {
+    entry = {
         "db_path": cfg.db_path,
         "backups_dir": cfg.backups_dir,
         "created_at": cfg.created_at,
         "updated_at": cfg.updated_at,
     }
+    # Nothing to do if the file already holds exactly this (current-schema) entry
+    if installs.get(install_id()) == entry and base == {
+        "schema_version": SCHEMA_VERSION,
+        "installs": installs,
+    }:
+        return
+    installs[install_id()] = entry
 
     out = {
         "schema_version": SCHEMA_VERSION,
         "installs": installs,
     }
 
-    p.write_text(
-        json.dumps(out, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    _clear_config_cache()
+    _ensure_parent(p)
+    p.write_bytes(jsonio.pretty_dumps(out))
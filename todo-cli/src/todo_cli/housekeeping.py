@@ -2,9 +2,7 @@ from __future__ import annotations
 import os, datetime as dt
 from pathlib import Path
 from typing import Optional, Tuple
-from .config import AppConfig, load_config_with_base_dir, save_config, save_install_config
 from .paths import default_db_path
-from .storage import FileLock, load_db, save_db, archive_path_for_db
 
 
 def now_iso() -> str:
@@ -17,6 +15,9 @@ def resolve_db_path(cli_db: str = "") -> Path:
     env = os.environ.get("TODO_DB", "").strip()
     if env:
         return Path(env).expanduser()
+    # Only import the config layer when we actually have to consult it.
+    from .config import load_config_with_base_dir
+
     cfg, base_dir = load_config_with_base_dir()
     if cfg.db_path:
         p = Path(cfg.db_path).expanduser()
@@ -27,56 +28,46 @@ def resolve_db_path(cli_db: str = "") -> Path:
     return default_db_path()
 
 
+def _ensure_db(p: Path) -> None:
+    """
+    Create an empty DB and archive next to p if missing; otherwise load them to validate.
+
+    Both files are handled under the DB lock alone: every archive writer takes
+    the DB lock before the archive lock, so holding it already excludes them.
+    """
+    # Local import: resolve_db_path() is on every command's path, this isn't.
+    from .storage import FileLock, load_db, save_db, archive_path_for_db
+
+    with FileLock(p.with_suffix(".lock")):
+        for path in (p, archive_path_for_db(p)):
+            try:
+                # Load validates the file; load_db handles corrupted files gracefully
+                _ = load_db(path, missing_ok=False)
+            except FileNotFoundError:
+                save_db(path, {"version": 1, "next_id": 1, "tasks": []})
+
+
 def init_config(
     db: Optional[str], dir_: Optional[str], force: bool = False
 ) -> Tuple[Path, Path]:
     # Historical return value: config_path() used to be returned here.
     # With install-config support, the actual config file could be either local or global.
     # Callers only use this for display, so we keep returning the global config_path().
+    from .config import load_config_with_base_dir, save_config, save_install_config
     from .paths import config_path
 
     cfg_p = config_path()
     cfg, base_dir = load_config_with_base_dir()
 
     # Save config (only overwrite if empty or force)
-    if (cfg.db_path and not force) and not (db or dir_):
-        # Nothing specified and already set; keep existing configured path.
+    if cfg.db_path and not force:
+        # Already set and no --force: keep existing configured path (whether or not
+        # a new --db-path/--dir was given), just make sure the files exist.
         p = Path(cfg.db_path).expanduser()
         if not p.is_absolute():
             p = (base_dir / p).expanduser()
         p.parent.mkdir(parents=True, exist_ok=True)
-        with FileLock(p.with_suffix(".lock")):
-            if not p.exists():
-                save_db(p, {"version": 1, "next_id": 1, "tasks": []})
-            else:
-                # Load validates the file; load_db handles corrupted files gracefully
-                _ = load_db(p)
-        ap = archive_path_for_db(p)
-        with FileLock(ap.with_suffix(".lock")):
-            if not ap.exists():
-                save_db(ap, {"version": 1, "next_id": 1, "tasks": []})
-            else:
-                _ = load_db(ap)
-        return cfg_p, p
-
-    if cfg.db_path and not force and (db or dir_):
-        # User is trying to change without force: keep existing configured path, ensure it exists.
-        p = Path(cfg.db_path).expanduser()
-        if not p.is_absolute():
-            p = (base_dir / p).expanduser()
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with FileLock(p.with_suffix(".lock")):
-            if not p.exists():
-                save_db(p, {"version": 1, "next_id": 1, "tasks": []})
-            else:
-                # Load validates the file; load_db handles corrupted files gracefully
-                _ = load_db(p)
-        ap = archive_path_for_db(p)
-        with FileLock(ap.with_suffix(".lock")):
-            if not ap.exists():
-                save_db(ap, {"version": 1, "next_id": 1, "tasks": []})
-            else:
-                _ = load_db(ap)
+        _ensure_db(p)
         return cfg_p, p
 
     # Determine db path (new/overwrite)
@@ -88,21 +79,8 @@ def init_config(
         db_path = default_db_path()
 
     db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with FileLock(db_path.with_suffix(".lock")):
-        if not db_path.exists():
-            save_db(db_path, {"version": 1, "next_id": 1, "tasks": []})
-        else:
-            # Load validates the file; load_db handles corrupted files gracefully
-            _ = load_db(db_path)
-
-    # Ensure archive file exists next to the DB (so deletes/archives are recoverable)
-    archive_path = archive_path_for_db(db_path)
-    with FileLock(archive_path.with_suffix(".lock")):
-        if not archive_path.exists():
-            save_db(archive_path, {"version": 1, "next_id": 1, "tasks": []})
-        else:
-            _ = load_db(archive_path)
+    # Also ensures the archive file next to the DB (so deletes/archives are recoverable)
+    _ensure_db(db_path)
 
     now = now_iso()
     if not cfg.created_at:
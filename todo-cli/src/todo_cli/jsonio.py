@@ -0,0 +1,39 @@
+from __future__ import annotations
+import json
+from typing import Any
+
+try:
+    import orjson  # optional: faster JSON (pip install "todo-cli[fast]")
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# orjson parses straight from a memoryview (e.g. over an mmap); json needs bytes/str.
+ACCEPTS_BUFFERS = orjson is not None
+
+# JSON helpers shared by config.py and storage.py. Both backends produce the
+# same bytes, so files stay identical (and readable by the VS Code extension)
+# whether or not orjson is installed.
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON from bytes/str, or a memoryview when ACCEPTS_BUFFERS.
+    Bad input raises json.JSONDecodeError (a ValueError).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (the on-disk DB format)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def pretty_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON indented by 2 spaces (config files, `todo export`)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -1,9 +1,13 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
+# slots=True (3.10+) drops the per-instance __dict__; on 3.9 Task stays a plain dataclass.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Task:
     id: int
     text: str
@@ -12,7 +16,7 @@ class Task:
     done_at: str = ""
     priority: str = ""
     due: str = ""
-    tags: List[str] = None
+    tags: List[str] = field(default_factory=list)
     # Bug tracking fields
     bug_status: str = ""  # open, in-progress, fixed, closed
     bug_assignee: str = ""
@@ -20,21 +24,43 @@ class Task:
     bug_steps: str = ""  # steps to reproduce
     bug_environment: str = ""  # dev, staging, prod, etc.
 
+    def __post_init__(self) -> None:
+        # Priority, bug status/severity/environment and tags come from a tiny
+        # vocabulary; interning shares one string object across all tasks.
+        # Done here so it also covers the msgspec decode in load_tasks().
+        intern = sys.intern
+        self.priority = intern(self.priority)
+        self.bug_status = intern(self.bug_status)
+        self.bug_severity = intern(self.bug_severity)
+        self.bug_environment = intern(self.bug_environment)
+        tags = self.tags
+        for i, tag in enumerate(tags):
+            tags[i] = intern(tag)
+
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        if d["tags"] is None:
-            d["tags"] = []
+        # Built by hand rather than via dataclasses.asdict(), which deep-copies
+        # every field; this runs once per task on every save.
+        d = {
+            "id": self.id,
+            "text": self.text,
+            "done": self.done,
+            "created_at": self.created_at,
+            "done_at": self.done_at,
+            "priority": self.priority,
+            "due": self.due,
+            "tags": list(self.tags),
+        }
         # Only include bug fields if they have values (backward compatibility)
-        bug_fields = [
-            "bug_status",
-            "bug_assignee",
-            "bug_severity",
-            "bug_steps",
-            "bug_environment",
-        ]
-        for field in bug_fields:
-            if not d.get(field):
-                d.pop(field, None)
+        if self.bug_status:
+            d["bug_status"] = self.bug_status
+        if self.bug_assignee:
+            d["bug_assignee"] = self.bug_assignee
+        if self.bug_severity:
+            d["bug_severity"] = self.bug_severity
+        if self.bug_steps:
+            d["bug_steps"] = self.bug_steps
+        if self.bug_environment:
+            d["bug_environment"] = self.bug_environment
         return d
 
     @staticmethod
@@ -47,7 +73,7 @@ class Task:
             done_at=str(d.get("done_at", "")),
             priority=str(d.get("priority", "")),
             due=str(d.get("due", "")),
-            tags=list(d.get("tags") or []),
+            tags=[str(t) for t in (d.get("tags") or [])],
             bug_status=str(d.get("bug_status", "")),
             bug_assignee=str(d.get("bug_assignee", "")),
             bug_severity=str(d.get("bug_severity", "")),
@@ -63,5 +89,5 @@ class Task:
             or bool(self.bug_severity)
             or bool(self.bug_steps)
             or bool(self.bug_environment)
-            or (self.tags and "bug" in [t.lower() for t in self.tags])
+            or any(t.lower() == "bug" for t in self.tags)
         )
@@ -1,27 +1,52 @@
 from __future__ import annotations
 import os, sys
+from functools import lru_cache
 from pathlib import Path
 
 APP_NAME = "todo-cli"
 INSTALL_CONFIG_ENV = "TODO_CLI_INSTALL_CONFIG"
 
+def _env_key() -> tuple:
+    # Everything the cached helpers below derive their result from. Keying the
+    # caches on it keeps them correct if the environment changes at runtime.
+    env = os.environ
+    return (
+        env.get("HOME"),
+        env.get("USERPROFILE"),
+        env.get("XDG_CONFIG_HOME"),
+        env.get("APPDATA"),
+    )
+
 def home() -> Path:
+    return _home(_env_key())
+
+@lru_cache(maxsize=None)
+def _home(key: tuple) -> Path:
     return Path.home()
 
 def config_dir() -> Path:
+    return _config_dir(_env_key())
+
+@lru_cache(maxsize=None)
+def _config_dir(key: tuple) -> Path:
     if os.name == "nt":
-        appdata = os.environ.get("APPDATA") or str(home() / "AppData" / "Roaming")
+        appdata = os.environ.get("APPDATA") or str(_home(key) / "AppData" / "Roaming")
         return Path(appdata) / APP_NAME
     if sys.platform == "darwin":
-        return home() / "Library" / "Application Support" / APP_NAME
+        return _home(key) / "Library" / "Application Support" / APP_NAME
     xdg = os.environ.get("XDG_CONFIG_HOME")
     if xdg:
         return Path(xdg) / APP_NAME
-    return home() / ".config" / APP_NAME
+    return _home(key) / ".config" / APP_NAME
 
 def config_path() -> Path:
-    return config_dir() / "config.json"
+    return _config_path(_env_key())
 
+@lru_cache(maxsize=None)
+def _config_path(key: tuple) -> Path:
+    return _config_dir(key) / "config.json"
+
+@lru_cache(maxsize=None)
 def install_dir() -> Path:
     """
     Directory where the Python package is installed from.
@@ -37,13 +62,23 @@ def install_config_path() -> Path:
 
     Can be overridden for testing via TODO_CLI_INSTALL_CONFIG.
     """
-    override = os.environ.get(INSTALL_CONFIG_ENV, "").strip()
+    # Not read once at import: tests (and embedders) set the override at runtime.
+    return _install_config_path(os.environ.get(INSTALL_CONFIG_ENV, ""), _env_key())
+
+@lru_cache(maxsize=None)
+def _install_config_path(override: str, key: tuple) -> Path:
+    # key: expanduser() of a "~/..." override depends on HOME.
+    override = override.strip()
     if override:
         return Path(override).expanduser()
     return install_dir() / "install-config.json"
 
 def default_db_path() -> Path:
-    docs = home() / "Documents"
+    return _default_db_path(_env_key())
+
+@lru_cache(maxsize=None)
+def _default_db_path(key: tuple) -> Path:
+    docs = _home(key) / "Documents"
     if docs.exists():
         return docs / "todo-cli" / "todos.json"
-    return home() / ".todo-cli" / "todos.json"
+    return _home(key) / ".todo-cli" / "todos.json"
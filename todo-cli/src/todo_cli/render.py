@@ -1,16 +1,23 @@
 from __future__ import annotations
-from typing import Iterable
-from rich.console import Console
-from rich.table import Table
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from rich.console import Console, Group, RenderableType
 from rich.text import Text
-from rich.panel import Panel
-from rich.columns import Columns
-from rich import box
-from rich.align import Align
-from datetime import datetime, date, timedelta
+from datetime import date
 from .model import Task
 
 
+_CONSOLE: Optional[Console] = None
+
+
+def _get_console() -> Console:
+    """Console shared by the render functions (built on first use)."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
 def calculate_statistics(tasks: Iterable[Task]) -> dict:
     """Public wrapper to compute task statistics for commands like `todo stats`."""
     return _calculate_statistics(list(tasks))
@@ -18,76 +25,140 @@ def calculate_statistics(tasks: Iterable[Task]) -> dict:
 
 def render_statistics_dashboard(stats: dict, title: str = "Stats") -> None:
     """Render a production-style stats dashboard (panels)."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = _get_console()
     console.print(
-        Panel.fit(
-            f"[bold bright_magenta]📊 {title}[/bold bright_magenta]",
-            border_style="bright_blue",
+        Group(
+            Panel.fit(
+                f"[bold bright_magenta]📊 {title}[/bold bright_magenta]",
+                border_style="bright_blue",
+            ),
+            Text(),
+            *_statistics_renderables(stats),
         )
     )
-    console.print()
-    _render_statistics(stats, console)
 
 
-def _format_status(done: bool) -> Text:
-    """Format status with modern indicators"""
-    if done:
-        return Text("✓", style="bold green")
-    return Text("○", style="bright_black")
+# Constant badges, built once and shared by every row. Rich only reads them
+# while rendering (and Text.append copies), so callers must not mutate them.
+_DASH = Text("—", style="dim")
+_STATUS_BADGES = {
+    True: Text("✓", style="bold green"),
+    False: Text("○", style="bright_black"),
+}
+_PRIORITY_BADGES = {
+    "high": Text("🔴 HIGH", style="bold white on red"),
+    "med": Text("🟡 MED", style="bold black on yellow"),
+    "low": Text("🔵 LOW", style="bold white on blue"),
+}
+_BUG_STATUS_STYLES = {
+    "open": "bold yellow",
+    "in-progress": "bold blue",
+    "fixed": "bold green",
+    "closed": "dim",
+}
+_BUG_STATUS_BADGES = {
+    status: Text(status.upper(), style=style)
+    for status, style in _BUG_STATUS_STYLES.items()
+}
+_BUG_SEVERITY_STYLES = {
+    "critical": "bold white on red",
+    "high": "bold white on yellow",
+    "medium": "bold black on blue",
+    "low": "bold white on cyan",
+}
+_BUG_SEVERITY_BADGES = {
+    severity: Text(severity.upper(), style=style)
+    for severity, style in _BUG_SEVERITY_STYLES.items()
+}
 
 
 def _format_priority(priority: str) -> Text:
     """Format priority with modern badges"""
-    pri = (priority or "").lower()
-    if pri == "high":
-        return Text("🔴 HIGH", style="bold white on red")
-    elif pri == "med":
-        return Text("🟡 MED", style="bold black on yellow")
-    elif pri == "low":
-        return Text("🔵 LOW", style="bold white on blue")
-    return Text("—", style="dim")
-
-
-def _format_due(due_str: str) -> Text:
-    """Format due date with badge-style UX (OVERDUE / TODAY / IN Nd)."""
+    return _PRIORITY_BADGES.get((priority or "").lower(), _DASH)
+
+
+# Single parse entry point for due dates (stored as YYYY-MM-DD). Kept as the C
+# date.fromisoformat: a pure-Python fixed-width slice + date(int, int, int)
+# parser measured ~10x slower on CPython 3.11.
+_parse_due = date.fromisoformat
+
+
+def _days_until(due_str: str, today_ord: int) -> Optional[int]:
+    """
+    Days from today (given as `date.toordinal()`) to the due date, negative
+    when overdue; None if unset/unparseable. Ordinal subtraction avoids a
+    timedelta per task.
+    """
     if not due_str:
-        return Text("—", style="dim")
+        return None
     try:
-        due_date = date.fromisoformat(due_str)
-        today = date.today()
-        days_until = (due_date - today).days
-
-        out = Text()
-        if days_until < 0:
-            overdue_days = abs(days_until)
-            out.append("OVERDUE", style="bold white on red")
-            out.append(" ")
-            out.append(due_str, style="dim")
-            out.append(f" ({overdue_days}d)", style="red")
-            return out
-        if days_until == 0:
-            out.append("TODAY", style="bold black on yellow")
-            out.append(" ")
-            out.append(due_str, style="dim")
-            return out
-
-        out.append(
-            f"IN {days_until}d",
-            style=(
-                "bold black on cyan" if days_until <= 7 else "bold black on bright_cyan"
-            ),
-        )
+        return _parse_due(due_str).toordinal() - today_ord
+    except (ValueError, TypeError):
+        return None
+
+
+def _format_due(due_str: str, today: Optional[date] = None) -> Text:
+    """
+    Format due date with badge-style UX (OVERDUE / TODAY / IN Nd).
+
+    Callers formatting many rows should pass `today` once instead of letting
+    every call look it up.
+    """
+    if not due_str:
+        return _DASH
+    return _format_due_days(due_str, _days_until(due_str, (today or date.today()).toordinal()))
+
+
+@lru_cache(maxsize=4096)
+def _format_due_days(due_str: str, days_until: Optional[int]) -> Text:
+    """
+    _format_due() for a due date already parsed by _days_until().
+
+    The badge depends only on these two values and many tasks share a due
+    date, so results are memoized (and shared, like the constant badges).
+    """
+    if not due_str:
+        return _DASH
+    if days_until is None:
+        return Text(due_str, style="dim")
+
+    out = Text()
+    if days_until < 0:
+        overdue_days = abs(days_until)
+        out.append("OVERDUE", style="bold white on red")
+        out.append(" ")
+        out.append(due_str, style="dim")
+        out.append(f" ({overdue_days}d)", style="red")
+        return out
+    if days_until == 0:
+        out.append("TODAY", style="bold black on yellow")
         out.append(" ")
         out.append(due_str, style="dim")
         return out
-    except (ValueError, TypeError):
-        return Text(due_str, style="dim")
+
+    out.append(
+        f"IN {days_until}d",
+        style=(
+            "bold black on cyan" if days_until <= 7 else "bold black on bright_cyan"
+        ),
+    )
+    out.append(" ")
+    out.append(due_str, style="dim")
+    return out
 
 
 def _format_tags(tags: list) -> Text:
     """Format tags with modern badge styling"""
     if not tags:
-        return Text("—", style="dim")
+        return _DASH
+    return _format_tag_tuple(tuple(tags))
+
+
+@lru_cache(maxsize=2048)
+def _format_tag_tuple(tags: Tuple[str, ...]) -> Text:
+    """_format_tags() body; tag combinations repeat a lot, so results are memoized."""
     tag_text = Text()
     for i, tag in enumerate(tags):
         if i > 0:
@@ -117,162 +188,144 @@ def _format_task_text(text: str, done: bool, priority: str) -> Text:
     return task_text
 
 
-def _calculate_statistics(tasks: list[Task]) -> dict:
+def _calculate_statistics(tasks: list[Task], today: Optional[date] = None) -> dict:
     """Calculate task statistics"""
-    total = len(tasks)
-    done = sum(1 for t in tasks if t.done)
-    pending = total - done
-    high_priority = sum(
-        1 for t in tasks if not t.done and (t.priority or "").lower() == "high"
-    )
-
-    overdue = 0
-    due_today = 0
-    due_soon = 0
-
-    today = date.today()
+    stats, _ = _prepare_rows(tasks, today or date.today())
+    return stats
+
+
+# Urgency row style for a pending task, indexed by high<<2 | overdue<<1 | due_today.
+# High priority wins, then overdue, then due today.
+_ROW_STYLES = (
+    None,  # 0b000
+    "bold yellow",  # 0b001 due today
+    "bold red",  # 0b010 overdue
+    "bold red",  # 0b011 (can't happen)
+    "bold",  # 0b1xx high priority
+    "bold",
+    "bold",
+    "bold",
+)
+
+
+def _prepare_rows(
+    tasks: list[Task], today: date
+) -> Tuple[dict, List[Tuple[Task, str, Optional[int], Optional[str]]]]:
+    """
+    One pass over the tasks producing both the statistics and, per task,
+    `(task, priority, days_until, row_style)` for the table: the lowercased
+    priority and days_until (from _days_until()) are computed only here.
+    """
+    done = high_priority = overdue = due_today = due_soon = 0
+    rows = []
+    # Tasks tend to share due dates; parse each distinct string once per pass.
+    days_by_due: dict = {}
+    today_ord = today.toordinal()
     for t in tasks:
-        if t.done or not t.due:
-            continue
+        pri = (t.priority or "").lower()
+        due_str = t.due
         try:
-            due_date = date.fromisoformat(t.due)
-            days_until = (due_date - today).days
-            if days_until < 0:
-                overdue += 1
-            elif days_until == 0:
-                due_today += 1
-            elif days_until <= 3:
-                due_soon += 1
-        except (ValueError, TypeError):
-            pass
-
-    return {
+            days_until = days_by_due[due_str]
+        except KeyError:
+            days_until = days_by_due[due_str] = _days_until(due_str, today_ord)
+        if t.done:
+            done += 1
+            row_style = None
+        else:
+            is_high = pri == "high"
+            if days_until is None:
+                is_overdue = is_today = False
+            else:
+                is_overdue = days_until < 0
+                is_today = days_until == 0
+                due_soon += 0 < days_until <= 3
+            high_priority += is_high
+            overdue += is_overdue
+            due_today += is_today
+            row_style = _ROW_STYLES[is_high << 2 | is_overdue << 1 | is_today]
+        rows.append((t, pri, days_until, row_style))
+
+    total = len(tasks)
+    stats = {
         "total": total,
         "done": done,
-        "pending": pending,
+        "pending": total - done,
         "high_priority": high_priority,
         "overdue": overdue,
         "due_today": due_today,
         "due_soon": due_soon,
     }
+    return stats, rows
 
 
-def _render_statistics(stats: dict, console: Console) -> None:
-    """Render statistics panel"""
-    if stats["total"] == 0:
-        return
+# Stats dashboard panels: (stats key, label, number style, border style).
+# Total is always shown; the others only when non-zero.
+_STAT_PANELS = (
+    ("total", "Total", "bold white", "blue"),
+    ("pending", "Pending", "bold yellow", "yellow"),
+    ("done", "Done", "bold green", "green"),
+    ("high_priority", "High Priority", "bold red", "red"),
+    ("overdue", "Overdue", "bold red", "red"),
+    ("due_today", "Due Today", "bold yellow", "yellow"),
+)
 
-    stats_items = []
 
-    # Total tasks
-    total_text = Text()
-    total_text.append(f"{stats['total']}", style="bold white")
-    total_text.append("\n")
-    total_text.append("Total", style="dim")
-    stats_items.append(
-        Panel(
-            Align.center(total_text),
-            border_style="blue",
-            padding=(0, 1),
-        )
-    )
+def _statistics_renderables(stats: dict) -> List[RenderableType]:
+    """Statistics panels (plus trailing blank line) to print; empty if there's nothing to show."""
+    if stats["total"] == 0:
+        return []
 
-    # Pending tasks
-    if stats["pending"] > 0:
-        pending_text = Text()
-        pending_text.append(f"{stats['pending']}", style="bold yellow")
-        pending_text.append("\n")
-        pending_text.append("Pending", style="dim")
-        stats_items.append(
-            Panel(
-                Align.center(pending_text),
-                border_style="yellow",
-                padding=(0, 1),
-            )
-        )
+    # Layout widgets are imported where used: `ls --plain` never needs them.
+    from rich.align import Align
+    from rich.columns import Columns
+    from rich.panel import Panel
 
-    # Done tasks
-    if stats["done"] > 0:
-        done_text = Text()
-        done_text.append(f"{stats['done']}", style="bold green")
-        done_text.append("\n")
-        done_text.append("Done", style="dim")
+    stats_items = []
+    for key, label, style, border in _STAT_PANELS:
+        value = stats[key]
+        if key != "total" and not value > 0:
+            continue
         stats_items.append(
             Panel(
-                Align.center(done_text),
-                border_style="green",
+                Align.center(Text.assemble((f"{value}", style), "\n", (label, "dim"))),
+                border_style=border,
                 padding=(0, 1),
             )
         )
 
-    # High priority
-    if stats["high_priority"] > 0:
-        high_text = Text()
-        high_text.append(f"{stats['high_priority']}", style="bold red")
-        high_text.append("\n")
-        high_text.append("High Priority", style="dim")
-        stats_items.append(
-            Panel(
-                Align.center(high_text),
-                border_style="red",
-                padding=(0, 1),
-            )
-        )
+    return [Columns(stats_items, equal=True, expand=True), Text()]
 
-    # Overdue
-    if stats["overdue"] > 0:
-        overdue_text = Text()
-        overdue_text.append(f"{stats['overdue']}", style="bold red")
-        overdue_text.append("\n")
-        overdue_text.append("Overdue", style="dim")
-        stats_items.append(
-            Panel(
-                Align.center(overdue_text),
-                border_style="red",
-                padding=(0, 1),
-            )
-        )
 
-    # Due today
-    if stats["due_today"] > 0:
-        today_text = Text()
-        today_text.append(f"{stats['due_today']}", style="bold yellow")
-        today_text.append("\n")
-        today_text.append("Due Today", style="dim")
-        stats_items.append(
-            Panel(
-                Align.center(today_text),
-                border_style="yellow",
-                padding=(0, 1),
-            )
-        )
+# Constant empty-state messages
+_NO_TASKS = Text("📭 No tasks found", style="dim")
+_NO_BUGS = Text("🐛 No bugs found", style="dim")
 
-    if stats_items:
-        console.print(Columns(stats_items, equal=True, expand=True))
-        console.print()
 
+@lru_cache(maxsize=None)
+def _empty_tasks_panel() -> RenderableType:
+    """The (constant) empty-table panel with its spacer lines; built on first use."""
+    from rich.align import Align
+    from rich.panel import Panel
+
+    return Group(
+        Text(),
+        Panel(Align.center(_NO_TASKS), border_style="dim", padding=(1, 2)),
+        Text(),
+    )
 
-def render_tasks_table(tasks: Iterable[Task], title: str = "TODOs") -> None:
-    console = Console()
-    task_list = list(tasks)
 
-    # Calculate statistics
-    stats = _calculate_statistics(task_list)
+def render_tasks_table(tasks: Iterable[Task], title: str = "TODOs") -> None:
+    from rich import box
+    from rich.table import Table
 
-    # Render statistics if there are tasks
-    if task_list:
-        _render_statistics(stats, console)
+    console = _get_console()
+    task_list = list(tasks)
+    # Statistics and per-row due/style data in a single pass
+    stats, rows = _prepare_rows(task_list, date.today())
 
     # Handle empty state
     if not task_list:
-        empty_panel = Panel(
-            Align.center(Text("📭 No tasks found", style="dim")),
-            border_style="dim",
-            padding=(1, 2),
-        )
-        console.print()
-        console.print(empty_panel)
-        console.print()
+        console.print(_empty_tasks_panel())
         return
 
     # Create modern table with production-grade styling
@@ -333,119 +386,121 @@ def render_tasks_table(tasks: Iterable[Task], title: str = "TODOs") -> None:
         header_style="bold bright_white",
     )
 
-    # Add rows with enhanced styling
-    for i, t in enumerate(task_list):
-        task_id = _format_task_id(t.id, t.done)
-        status = _format_status(t.done)
-        priority = _format_priority(t.priority)
-        due = _format_due(t.due)
-        tags = _format_tags(t.tags or [])
-        task_text = _format_task_text(t.text or "", t.done, t.priority)
-
-        # Determine row style based on urgency
-        row_style = None
-        if not t.done:
-            pri = (t.priority or "").lower()
-            if pri == "high":
-                row_style = "bold"
-            elif t.due:
-                try:
-                    due_date = date.fromisoformat(t.due)
-                    days_until = (due_date - date.today()).days
-                    if days_until < 0:
-                        row_style = "bold red"
-                    elif days_until == 0:
-                        row_style = "bold yellow"
-                except (ValueError, TypeError):
-                    pass
-
-        table.add_row(
-            task_id,
-            status,
-            priority,
-            due,
-            tags,
-            task_text,
+    # Add rows with enhanced styling. Formatters and lookups are bound to
+    # locals so the loop body doesn't repeat global/attribute lookups per row.
+    add_row = table.add_row
+    format_id = _format_task_id
+    status_badges = _STATUS_BADGES
+    priority_badge = _PRIORITY_BADGES.get
+    dash = _DASH
+    format_due = _format_due_days
+    format_tags = _format_tags
+    format_text = _format_task_text
+    for t, pri, days_until, row_style in rows:
+        done = t.done  # read once; used by three cells
+        add_row(
+            format_id(t.id, done),
+            status_badges[bool(done)],
+            priority_badge(pri, dash),
+            format_due(t.due, days_until),
+            format_tags(t.tags or []),
+            format_text(t.text or "", done, pri),
             style=row_style,
         )
 
-    # Render table
-    console.print()
-    console.print(table)
-    console.print()
+    # Render statistics and table in one print
+    console.print(Group(*_statistics_renderables(stats), Text(), table, Text()))
 
 
 def render_tasks_plain(tasks: Iterable[Task]) -> None:
     """Render tasks in plain text format with modern styling"""
-    console = Console()
+    console = _get_console()
     task_list = list(tasks)
 
     if not task_list:
-        console.print("[dim]📭 No tasks found[/dim]")
+        console.print(_NO_TASKS)
+        return
+
+    today = date.today()
+    if not console.is_terminal:
+        # Piped/redirected: styles would be dropped anyway, so skip Rich's
+        # render pipeline and write the same text (unwrapped) in one go.
+        console.file.write("".join(_plain_line(t, today) for t in task_list))
         return
 
+    lines = []
     # Use the same formatting functions for consistency
     for t in task_list:
-        task_id = _format_task_id(t.id, t.done)
-        status = _format_status(t.done)
-        priority = _format_priority(t.priority)
-        due = _format_due(t.due)
-        tags = _format_tags(t.tags or [])
-        task_text = _format_task_text(t.text or "", t.done, t.priority)
-
-        # Build the line with consistent spacing
-        line = Text()
-        line.append(status)
-        line.append("  ")
-        line.append(task_id)
-        line.append("  ")
-        line.append(priority)
-        line.append("  ")
-        line.append(due)
-        if t.tags:  # Only add tags if they exist
-            line.append("  ")
-            line.append(tags)
-        line.append("  ")
-        line.append(task_text)
-
-        console.print(line)
+        # Read each field once; several cells share them
+        done = bool(t.done)
+        pri = (t.priority or "").lower()
+        tag_list = t.tags
+        task_id = _format_task_id(t.id, done)
+        status = _STATUS_BADGES[done]
+        priority = _PRIORITY_BADGES.get(pri, _DASH)
+        due = _format_due(t.due, today)
+        tags = _format_tags(tag_list or [])
+        task_text = _format_task_text(t.text or "", done, pri)
+
+        # Build the line with consistent spacing (tags only if they exist)
+        if tag_list:
+            line = Text.assemble(
+                status, "  ", task_id, "  ", priority, "  ", due, "  ", tags, "  ", task_text
+            )
+        else:
+            line = Text.assemble(
+                status, "  ", task_id, "  ", priority, "  ", due, "  ", task_text
+            )
+        lines.append(line)
+
+    # One print for the whole list rather than one per task
+    console.print(Text("\n").join(lines))
+
+
+def _plain_line(t: Task, today: date) -> str:
+    """One render_tasks_plain() line as unstyled text (newline-terminated)."""
+    parts = [
+        _STATUS_BADGES[bool(t.done)].plain,
+        f"#{t.id}",
+        _PRIORITY_BADGES.get((t.priority or "").lower(), _DASH).plain,
+        _format_due(t.due, today).plain,
+    ]
+    if t.tags:
+        parts.append(_format_tags(t.tags).plain)
+    parts.append(t.text or "")
+    return "  ".join(parts) + "\n"
 
 
 def _format_bug_status(status: str) -> Text:
     """Format bug status with color coding."""
     status_lower = (status or "open").lower()
-    status_colors = {
-        "open": "bold yellow",
-        "in-progress": "bold blue",
-        "fixed": "bold green",
-        "closed": "dim",
-    }
-    style = status_colors.get(status_lower, "white")
-    return Text(status_lower.upper(), style=style)
+    badge = _BUG_STATUS_BADGES.get(status_lower)
+    if badge is not None:
+        return badge
+    return Text(status_lower.upper(), style="white")
 
 
 def _format_bug_severity(severity: str) -> Text:
     """Format bug severity with color coding."""
     if not severity:
-        return Text("—", style="dim")
+        return _DASH
     severity_lower = severity.lower()
-    severity_styles = {
-        "critical": "bold white on red",
-        "high": "bold white on yellow",
-        "medium": "bold black on blue",
-        "low": "bold white on cyan",
-    }
-    style = severity_styles.get(severity_lower, "white")
-    return Text(severity_lower.upper(), style=style)
+    badge = _BUG_SEVERITY_BADGES.get(severity_lower)
+    if badge is not None:
+        return badge
+    return Text(severity_lower.upper(), style="white")
 
 
 def render_bugs_table(bugs: Iterable[Task], title: str = "Bugs") -> None:
     """Render bugs in a table with bug-specific columns."""
-    console = Console()
+    from rich import box
+    from rich.table import Table
+
+    console = _get_console()
     bug_list = list(bugs)
 
     if not bug_list:
-        console.print("[dim]🐛 No bugs found[/dim]")
+        console.print(_NO_BUGS)
         return
 
     table = Table(
@@ -545,14 +600,14 @@ def render_bugs_table(bugs: Iterable[Task], title: str = "Bugs") -> None:
             bug_text,
         )
 
-    console.print()
-    console.print(table)
-    console.print()
+    console.print(Group(Text(), table, Text()))
 
 
 def render_bug_detail(bug: Task) -> None:
     """Render detailed bug information in a panel."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = _get_console()
 
     # Build detailed bug info
     info_lines = []
@@ -592,13 +647,15 @@ def render_bug_detail(bug: Task) -> None:
             content.append(str(value), style="white")
         content.append("\n")
 
-    console.print()
     console.print(
-        Panel(
-            content,
-            title=f"[bold red]🐛 Bug #{bug.id}[/bold red]",
-            border_style="red",
-            padding=(1, 2),
+        Group(
+            Text(),
+            Panel(
+                content,
+                title=f"[bold red]🐛 Bug #{bug.id}[/bold red]",
+                border_style="red",
+                padding=(1, 2),
+            ),
+            Text(),
         )
     )
-    console.print()
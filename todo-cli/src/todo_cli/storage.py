@@ -1,14 +1,36 @@
 from __future__ import annotations
-import json, os, tempfile
+import errno, json, mmap, os, tempfile, threading, time
 import datetime as dt
 import shutil
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from . import jsonio
 from .model import Task
 
+try:
+    import msgspec  # optional: decode the DB straight into Task objects
+except ImportError:  # pragma: no cover - depends on environment
+    msgspec = None
+
 VERSION = 1
 PRIORITY_ORDER = {"high": 0, "med": 1, "low": 2, "": 3, None: 3}
 BACKUP_KEEP_DEFAULT = 5
+# Below this size a plain read() is cheaper than setting up a mapping.
+MMAP_THRESHOLD = 64 * 1024
+
+
+@dataclass
+class DBFile:
+    """On-disk DB layout; used as the msgspec decode target in load_tasks()."""
+
+    version: int = VERSION
+    next_id: int = 1
+    tasks: List[Task] = field(default_factory=list)
+
+
+_db_decoder = msgspec.json.Decoder(DBFile) if msgspec is not None else None
 
 
 def migrate_db_data(db: Dict[str, Any]) -> Tuple[Dict[str, Any], int, int, List[str]]:
@@ -54,16 +76,23 @@ def ensure_parent(p: Path) -> None:
 
 
 def atomic_write_json(path: Path, obj: Any) -> None:
+    _atomic_write_bytes(path, jsonio.dumps(obj))
+
+
+# Only the temp file's data (and size) must be durable before the rename;
+# fdatasync skips the timestamp flush. Not available on macOS/Windows.
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
     ensure_parent(path)
-    data = json.dumps(obj, indent=2, ensure_ascii=False)
-    with tempfile.NamedTemporaryFile(
-        "w", delete=False, dir=str(path.parent), encoding="utf-8"
-    ) as tf:
+    with tempfile.NamedTemporaryFile("wb", delete=False, dir=str(path.parent)) as tf:
         tf.write(data)
         tf.flush()
-        os.fsync(tf.fileno())
+        _datasync(tf.fileno())
         tmp = tf.name
     os.replace(tmp, path)
+    _db_cache.pop(str(path), None)
 
 
 def backup_paths(db_path: Path, keep: int = BACKUP_KEEP_DEFAULT) -> List[Path]:
@@ -90,10 +119,20 @@ def rotate_backups(db_path: Path, keep: int = BACKUP_KEEP_DEFAULT) -> None:
             except Exception:
                 pass
 
-    # Copy current to .1
+    # Snapshot current to .1. The DB is only ever replaced by a new file
+    # (os.replace), never rewritten in place, so a hard link keeps the old
+    # content without copying it.
     dst1 = db_path.with_name(f"{db_path.name}.1")
     try:
-        shutil.copy2(db_path, dst1)
+        try:
+            os.unlink(dst1)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(db_path, dst1)
+        except OSError:
+            # Filesystem without hard links (or other link failure): copy instead
+            shutil.copy2(db_path, dst1)
     except Exception:
         pass
 
@@ -103,35 +142,107 @@ def restore_latest_backup(db_path: Path, keep: int = BACKUP_KEEP_DEFAULT) -> boo
     for p in backup_paths(db_path, keep=keep):
         if p.exists():
             try:
-                shutil.copy2(p, db_path)
+                # Replace rather than copy over db_path: it may be a hard link
+                # to one of the backups, which must not be modified in place.
+                _atomic_write_bytes(db_path, p.read_bytes())
                 return True
             except Exception:
                 return False
     return False
 
 
+# Backoff between non-blocking attempts when FileLock is given a timeout.
+_LOCK_BACKOFF = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05)
+
+# Locks held in this process: (absolute lock path, thread id) -> [file, depth].
+_held_locks: Dict[Tuple[str, int], list] = {}
+
+
 class FileLock:
-    def __init__(self, lock_path: Path):
+    """
+    Exclusive inter-process lock on a sidecar file.
+
+    With timeout=None (the default) this waits for the lock. With a timeout in
+    seconds it polls with backoff and raises TimeoutError if the lock is still
+    held when the time runs out.
+
+    Reentrant per thread: a nested FileLock on a path this thread already holds
+    reuses the open lock file and only releases when the outermost one exits,
+    so callers can hold the lock across a whole transaction.
+    """
+
+    def __init__(self, lock_path: Path, timeout: Optional[float] = None):
         self.lock_path = lock_path
+        self.timeout = timeout
         self.fp = None
+        self._key: Optional[Tuple[str, int]] = None
 
     def __enter__(self):
+        key = (os.path.abspath(self.lock_path), threading.get_ident())
+        held = _held_locks.get(key)
+        if held is not None:
+            held[1] += 1
+            self.fp, self._key = held[0], key
+            return self
         ensure_parent(self.lock_path)
         self.fp = open(self.lock_path, "a+", encoding="utf-8")
         try:
-            if os.name == "nt":
-                import msvcrt  # type: ignore
-
-                msvcrt.locking(self.fp.fileno(), msvcrt.LK_LOCK, 1)
+            if self.timeout is None:
+                self._lock(blocking=True)
             else:
-                import fcntl  # type: ignore
-
-                fcntl.flock(self.fp.fileno(), fcntl.LOCK_EX)
+                self._lock_with_timeout(self.timeout)
+        except TimeoutError:
+            self.fp.close()
+            self.fp = None
+            raise
         except Exception:
             pass
+        _held_locks[key] = [self.fp, 1]
+        self._key = key
         return self
 
+    def _lock(self, blocking: bool) -> None:
+        """Take the lock; non-blocking attempts raise OSError if it is held."""
+        if os.name == "nt":
+            import msvcrt  # type: ignore
+
+            mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+            msvcrt.locking(self.fp.fileno(), mode, 1)
+        else:
+            import fcntl  # type: ignore
+
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            fcntl.flock(self.fp.fileno(), flags)
+
+    def _lock_with_timeout(self, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            try:
+                self._lock(blocking=False)
+                return
+            except OSError as e:
+                # BlockingIOError (POSIX) or EDEADLK/EACCES (Windows) mean "held".
+                if not isinstance(e, BlockingIOError) and e.errno not in (
+                    errno.EACCES,
+                    errno.EAGAIN,
+                    errno.EDEADLK,
+                ):
+                    raise
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timed out after {timeout}s waiting for lock: {self.lock_path}")
+            delay = _LOCK_BACKOFF[min(attempt, len(_LOCK_BACKOFF) - 1)]
+            time.sleep(min(delay, remaining))
+            attempt += 1
+
     def __exit__(self, exc_type, exc, tb):
+        held = _held_locks.get(self._key) if self._key else None
+        if held is not None:
+            held[1] -= 1
+            if held[1] > 0:
+                return
+            del _held_locks[self._key]
         try:
             if self.fp:
                 if os.name == "nt":
@@ -147,29 +258,109 @@ class FileLock:
             pass
 
 
-def load_db(db_path: Path) -> Dict[str, Any]:
-    if not db_path.exists():
-        return {"version": VERSION, "next_id": 1, "tasks": []}
+@contextmanager
+def _read_buffer(f: BinaryIO, size: int, accepts_buffers: bool) -> Iterator[Any]:
+    """
+    Yield the contents of the open file `f` (`size` bytes) for a parser:
+    bytes for small files, or a memoryview over a read-only mmap for large
+    ones (no copy into a Python buffer) when the parser `accepts_buffers`.
+    """
+    if size < MMAP_THRESHOLD or not accepts_buffers:
+        yield f.read()
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            yield view
+
+
+# Parsed DBs by path: (stat signature, data). Every write replaces the file,
+# which changes the inode/mtime, so a matching signature means unchanged content.
+_db_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+
+def _copy_db(db: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached DB deep enough for callers to mutate it: the dict, the task
+    list, each task dict and its tags. Much cheaper than copy.deepcopy.
+    """
+    out = dict(db)
+    tasks = out.get("tasks")
+    if isinstance(tasks, list):
+        out["tasks"] = [
+            {**t, "tags": list(t["tags"])}
+            if isinstance(t, dict) and isinstance(t.get("tags"), list)
+            else (dict(t) if isinstance(t, dict) else t)
+            for t in tasks
+        ]
+    return out
+
+
+def load_db(db_path: Path, missing_ok: bool = True) -> Dict[str, Any]:
+    """
+    Load the DB dict. Empty/corrupted files yield an empty DB; a missing file
+    does too unless missing_ok=False, in which case FileNotFoundError propagates.
+
+    Parsed files are cached per process (keyed on mtime/size/inode) and a copy
+    is returned, so repeated load_db calls on an unchanged file skip the JSON
+    parse. load_tasks only goes through here when msgspec is not installed;
+    its typed decode costs about the same as rebuilding Tasks from a cache.
+    """
+    key = str(db_path)
     try:
-        with open(db_path, "r", encoding="utf-8") as f:
-            content = f.read().strip()
-            if not content:
+        with open(db_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            cached = _db_cache.get(key)
+            if cached is not None and cached[0] == sig:
+                return _copy_db(cached[1])
+            if st.st_size == 0:
                 # Empty file - return default
                 return {"version": VERSION, "next_id": 1, "tasks": []}
-            data = json.loads(content)
+            # Both parsers skip surrounding whitespace; a whitespace-only
+            # file fails to parse and gets the default below.
+            with _read_buffer(f, st.st_size, jsonio.ACCEPTS_BUFFERS) as buf:
+                data = jsonio.loads(buf)
+    except FileNotFoundError:
+        if not missing_ok:
+            raise
+        return {"version": VERSION, "next_id": 1, "tasks": []}
     except (json.JSONDecodeError, ValueError):
         # Corrupted JSON - return default
         return {"version": VERSION, "next_id": 1, "tasks": []}
     data.setdefault("version", VERSION)
     data.setdefault("next_id", 1)
     data.setdefault("tasks", [])
-    return data
+    _db_cache[key] = (sig, data)
+    return _copy_db(data)
+
+
+def _has_content(path: Path, data: bytes) -> bool:
+    """True if the file at path holds exactly `data` (size check first, then bytes)."""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
 
 
 def save_db(db_path: Path, data: Dict[str, Any]) -> None:
+    """
+    Persist the whole DB (after rotating a backup). If the file already holds
+    exactly these bytes, nothing is written and no backup is rotated.
+
+    The file must always be one complete JSON document: the VS Code extension
+    reads and rewrites todos.json / the archive directly (JSON.parse + rename),
+    so changes can't live in a side log (WAL) that only this package replays.
+    It is written as compact JSON; `todo export` pretty-prints it.
+    """
+    payload = jsonio.dumps(data)
+    if _has_content(db_path, payload):
+        return
     # Backup current DB before write
     rotate_backups(db_path, keep=BACKUP_KEEP_DEFAULT)
-    atomic_write_json(db_path, data)
+    _atomic_write_bytes(db_path, payload)
 
 
 def archive_path_for_db(db_path: Path) -> Path:
@@ -184,20 +375,32 @@ def append_tasks_to_archive(archive_path: Path, tasks: List[Task]) -> int:
     if not tasks:
         return 0
     adb = load_db(archive_path)
-    existing = list(adb.get("tasks") or [])
-    existing.extend([t.to_dict() for t in tasks])
-    adb["tasks"] = existing
-    # Keep next_id reasonable for potential future use
-    try:
-        max_id = max(int(t.get("id", 0)) for t in existing) if existing else 0
-    except Exception:
-        max_id = 0
+    existing = adb.get("tasks")
+    if not isinstance(existing, list):
+        existing = adb["tasks"] = []
+    # load_db hands back a private copy, so extend it in place.
+    existing.extend(t.to_dict() for t in tasks)
+    # Keep next_id reasonable for potential future use. Every writer (this and
+    # the VS Code extension) keeps it above the stored ids, so only the new
+    # tasks need checking rather than rescanning the whole archive.
+    max_id = max(t.id for t in tasks)
     adb["next_id"] = max(int(adb.get("next_id", 1)), max_id + 1)
     save_db(archive_path, adb)
     return len(tasks)
 
 
 def load_tasks(db_path: Path) -> Tuple[int, List[Task]]:
+    if _db_decoder is not None:
+        # Fast path: typed decode in C. Anything it rejects (missing/empty file,
+        # legacy value types, bad JSON) falls through to the tolerant dict path.
+        try:
+            with open(db_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                with _read_buffer(f, size, accepts_buffers=True) as buf:
+                    db_file = _db_decoder.decode(buf)
+            return db_file.next_id, db_file.tasks
+        except (OSError, msgspec.DecodeError):
+            pass
     db = load_db(db_path)
     next_id = int(db.get("next_id", 1))
     tasks = [Task.from_dict(t) for t in (db.get("tasks") or [])]
@@ -217,26 +420,38 @@ def save_tasks(db_path: Path, next_id: int, tasks: List[Task]) -> None:
 
 def sort_tasks(tasks: List[Task], sort: str) -> List[Task]:
     sort = (sort or "created").lower()
+    # key= runs once per task (N lookups, not N log N); bind the lookup locally.
+    rank = PRIORITY_ORDER.get
     if sort == "due":
-
-        def due_key(t: Task):
-            # Bucket: 0 = overdue, 1 = has due date (today/future), 2 = no/invalid due date
-            due_s = (t.due or "").strip()
+        # Overdue first, then today/upcoming, then no/invalid due date. Ordering
+        # by the due date's ordinal gives exactly that (overdue < today <= future)
+        # without depending on today's date. Each distinct due string is parsed
+        # once; many tasks share a handful of dates.
+        no_due = 10**9
+        ordinals: Dict[str, int] = {}
+
+        def due_ordinal(due: str) -> int:
+            due_s = due.strip()
             if not due_s:
-                return (2, 10**9, PRIORITY_ORDER.get(t.priority, 3), t.id)
+                return no_due
             try:
-                days_until = (dt.date.fromisoformat(due_s) - dt.date.today()).days
+                return dt.date.fromisoformat(due_s).toordinal()
             except ValueError:
-                return (2, 10**9, PRIORITY_ORDER.get(t.priority, 3), t.id)
-            bucket = 0 if days_until < 0 else 1
-            return (bucket, days_until, PRIORITY_ORDER.get(t.priority, 3), t.id)
+                return no_due
+
+        def due_key(t: Task):
+            due = t.due or ""
+            o = ordinals.get(due)
+            if o is None:
+                o = ordinals[due] = due_ordinal(due)
+            return (o, rank(t.priority, 3), t.id)
 
         return sorted(tasks, key=due_key)
     if sort == "priority":
         return sorted(
             tasks,
             key=lambda t: (
-                PRIORITY_ORDER.get(t.priority, 3),
+                rank(t.priority, 3),
                 t.due or "9999-12-31",
                 t.id,
             ),
@@ -1,32 +1,26 @@
 from __future__ import annotations
-from typing import List, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 from prompt_toolkit.shortcuts import checkboxlist_dialog
 from datetime import date
 from .model import Task
 
 
-def _format_task_for_picker(t: Task) -> str:
+_PICKER_PRIORITY = {"high": " 🔴 HIGH", "med": " 🟡 MED", "low": " 🔵 LOW"}
+
+
+def _format_task_for_picker(t: Task, today: Optional[date] = None) -> str:
     """Format a task for the picker dialog with colors and emojis"""
     status = "✓" if t.done else "○"
 
     # Priority indicator
-    pri_str = ""
-    if t.priority:
-        pri = t.priority.lower()
-        if pri == "high":
-            pri_str = " 🔴 HIGH"
-        elif pri == "med":
-            pri_str = " 🟡 MED"
-        elif pri == "low":
-            pri_str = " 🔵 LOW"
+    pri_str = _PICKER_PRIORITY.get(t.priority.lower(), "") if t.priority else ""
 
     # Due date indicator
     due_str = ""
     if t.due:
         try:
             due_date = date.fromisoformat(t.due)
-            today = date.today()
-            days_until = (due_date - today).days
+            days_until = (due_date - (today or date.today())).days
             if days_until < 0:
                 due_str = f" ⚠️  {t.due} (overdue)"
             elif days_until == 0:
@@ -56,10 +50,8 @@ def _format_task_for_picker(t: Task) -> str:
 
 
 def pick_tasks_to_done(tasks: Sequence[Task]) -> List[int]:
-    values: List[Tuple[int, str]] = []
-    for t in tasks:
-        formatted = _format_task_for_picker(t)
-        values.append((t.id, formatted))
+    today = date.today()
+    values: List[Tuple[int, str]] = [(t.id, _format_task_for_picker(t, today)) for t in tasks]
     if not values:
         return []
     result = checkboxlist_dialog(
@@ -0,0 +1,21 @@
+from pathlib import Path
+import tempfile
+
+
+def test_noop_mutations_report_no_change_and_skip_write(capsys):
+    from todo_cli.cli import run
+
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        db = str(db_path)
+        run(["--db", db, "add", "Fix login", "--p", "high"])
+        run(["--db", db, "bug", "status", "1", "open"])
+        before = db_path.stat()
+        capsys.readouterr()
+
+        run(["--db", db, "pri", "1", "high"])
+        run(["--db", db, "bug", "status", "1", "open"])
+
+        assert capsys.readouterr().out.count("(no change) #1") == 2
+        after = db_path.stat()
+        assert (after.st_mtime_ns, after.st_ino) == (before.st_mtime_ns, before.st_ino)
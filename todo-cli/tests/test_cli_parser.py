@@ -14,3 +14,26 @@ def test_parser_accepts_done_without_id():
     args = p.parse_args(["done"])
     assert args.cmd == "done"
     assert args.id is None
+
+
+def test_lazy_parser_builds_only_requested_subcommand():
+    from todo_cli.cli import _positionals, build_parser
+
+    assert next(_positionals(["--db", "x.json", "ls", "--all"]), None) == "ls"
+    assert next(_positionals(["--help"]), None) is None
+
+    p = build_parser("stats")
+    args = p.parse_args(["stats", "--json"])
+    assert args.cmd == "stats"
+    assert args.json is True
+
+
+def test_lazy_parser_builds_only_requested_bug_subcommand():
+    from todo_cli.cli import build_parser, cmd_bug_severity
+
+    p = build_parser("bug", "severity")
+    args = p.parse_args(["bug", "severity", "3", "high"])
+    assert args.bug_cmd == "severity"
+    assert args.id == 3
+    assert args.severity == "high"
+    assert args.fn is cmd_bug_severity
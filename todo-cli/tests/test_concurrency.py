@@ -27,6 +27,15 @@ def _worker(db_path_str: str, n: int) -> None:
             save_tasks(db_path, next_id + 1, tasks)
 
 
+def _batch_worker(db_path_str: str, n: int) -> None:
+    # Holds the lock across all n writes; the inner FileLock re-enters it.
+    from todo_cli.storage import FileLock
+
+    db_path = Path(db_path_str)
+    with FileLock(db_path.with_suffix(".lock")):
+        _worker(db_path_str, n)
+
+
 def test_concurrent_writes_do_not_corrupt_db():
     # This is a smoke test to ensure FileLock + atomic writes keep JSON valid
     with tempfile.TemporaryDirectory() as td:
@@ -51,3 +60,65 @@ def test_concurrent_writes_do_not_corrupt_db():
         ids = [int(t.get("id")) for t in tasks]
         assert len(ids) == 50
         assert len(set(ids)) == 50
+
+
+def test_nested_filelock_writers_do_not_corrupt_db():
+    # One process holds the lock across all of its writes (the inner per-write
+    # FileLock re-enters it) while another contends per write.
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+
+        procs = [
+            mp.Process(target=_batch_worker, args=(str(db_path), 25)),
+            mp.Process(target=_worker, args=(str(db_path), 25)),
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=30)
+
+        for p in procs:
+            assert p.exitcode == 0
+
+        from todo_cli.storage import load_db
+
+        ids = [int(t.get("id")) for t in load_db(db_path).get("tasks") or []]
+        assert len(ids) == 50
+        assert len(set(ids)) == 50
+
+
+def test_filelock_timeout_raises_while_held():
+    import threading
+    from todo_cli.storage import FileLock
+
+    with tempfile.TemporaryDirectory() as td:
+        lock_path = Path(td) / "todos.lock"
+        errors = []
+
+        def contend():
+            try:
+                with FileLock(lock_path, timeout=0.05):
+                    pass
+            except TimeoutError as e:
+                errors.append(e)
+
+        # Held by another thread, so the reentrant fast path does not apply.
+        with FileLock(lock_path):
+            t = threading.Thread(target=contend)
+            t.start()
+            t.join()
+        assert len(errors) == 1
+        with FileLock(lock_path, timeout=0.05):
+            pass
+
+
+def test_filelock_is_reentrant_within_a_thread():
+    from todo_cli.storage import FileLock
+
+    with tempfile.TemporaryDirectory() as td:
+        lock_path = Path(td) / "todos.lock"
+        with FileLock(lock_path) as outer:
+            with FileLock(lock_path, timeout=0.05) as inner:
+                assert inner.fp is outer.fp
+            assert not outer.fp.closed
+        assert outer.fp.closed
@@ -1,6 +1,9 @@
+import json
 from pathlib import Path
 import tempfile
 
+import pytest
+
 
 def test_save_creates_backup_on_second_write():
     from todo_cli.storage import save_db
@@ -13,6 +16,171 @@ def test_save_creates_backup_on_second_write():
         assert (db_path.with_name(db_path.name + ".1")).exists()
 
 
+def test_backups_keep_previous_contents():
+    from todo_cli.storage import restore_latest_backup, save_db
+
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        for next_id in (1, 2, 3):
+            save_db(db_path, {"version": 1, "next_id": next_id, "tasks": []})
+
+        def next_id_of(p):
+            return json.loads(p.read_text(encoding="utf-8"))["next_id"]
+
+        def backup(i):
+            return db_path.with_name(f"{db_path.name}.{i}")
+
+        assert next_id_of(backup(1)) == 2
+        assert next_id_of(backup(2)) == 1
+
+        assert restore_latest_backup(db_path)
+        assert next_id_of(db_path) == 2
+        assert next_id_of(backup(2)) == 1
+
+
+def test_save_skips_unchanged_payload():
+    from todo_cli.storage import save_db
+
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        save_db(db_path, {"version": 1, "next_id": 1, "tasks": []})
+        before = db_path.stat()
+        save_db(db_path, {"version": 1, "next_id": 1, "tasks": []})
+
+        assert not (db_path.with_name(db_path.name + ".1")).exists()
+        assert db_path.stat().st_ino == before.st_ino
+
+
+def test_load_db_cache_returns_independent_copies():
+    from todo_cli.storage import load_db, save_db
+
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        save_db(db_path, {"version": 1, "next_id": 2, "tasks": [{"id": 1, "text": "a", "tags": ["x"]}]})
+
+        first = load_db(db_path)
+        first["tasks"][0]["tags"].append("y")
+        first["tasks"].append({"id": 2})
+        assert load_db(db_path)["tasks"] == [{"id": 1, "text": "a", "tags": ["x"]}]
+
+        save_db(db_path, {"version": 1, "next_id": 3, "tasks": []})
+        assert load_db(db_path)["tasks"] == []
+
+
+def test_db_is_stored_compact_and_exported_pretty(capsys):
+    from todo_cli.cli import run
+    from todo_cli.storage import save_db
+
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        save_db(db_path, {"version": 1, "next_id": 1, "tasks": []})
+        assert db_path.read_text(encoding="utf-8") == '{"version":1,"next_id":1,"tasks":[]}'
+
+        run(["--db", str(db_path), "export"])
+        assert capsys.readouterr().out == '{\n  "version": 1,\n  "next_id": 1,\n  "tasks": []\n}\n'
+
+
+def test_archive_append_bumps_next_id_past_new_tasks():
+    from todo_cli.model import Task
+    from todo_cli.storage import append_tasks_to_archive, load_db
+
+    with tempfile.TemporaryDirectory() as td:
+        archive = Path(td) / "todos-archieved.json"
+        append_tasks_to_archive(archive, [Task(id=7, text="a"), Task(id=3, text="b")])
+        append_tasks_to_archive(archive, [Task(id=2, text="c")])
+
+        adb = load_db(archive)
+        assert [t["id"] for t in adb["tasks"]] == [7, 3, 2]
+        assert adb["next_id"] == 8
+
+
+def test_load_tasks_dict_path_uses_db_cache(monkeypatch):
+    from todo_cli import storage
+    from todo_cli.model import Task
+
+    # Without msgspec, load_tasks reads through load_db and its cache.
+    monkeypatch.setattr(storage, "_db_decoder", None)
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        storage.save_tasks(db_path, 2, [Task(id=1, text="a", tags=["x"])])
+
+        _, first = storage.load_tasks(db_path)
+        assert str(db_path) in storage._db_cache
+        first[0].text = "changed"
+        first[0].tags.append("y")
+        _, second = storage.load_tasks(db_path)
+        assert (second[0].text, second[0].tags) == ("a", ["x"])
+
+        storage.save_tasks(db_path, 3, [Task(id=2, text="b")])
+        next_id, tasks = storage.load_tasks(db_path)
+        assert next_id == 3
+        assert [t.text for t in tasks] == ["b"]
+
+
+def test_load_tasks_interns_low_cardinality_strings():
+    import sys
+    from todo_cli.model import Task
+    from todo_cli.storage import load_tasks, save_tasks
+
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        save_tasks(db_path, 2, [Task(id=1, text="a", priority="high", tags=["backend"])])
+        _, (t,) = load_tasks(db_path)
+        assert t.priority is sys.intern("high")
+        assert t.tags[0] is sys.intern("backend")
+
+
+# DB fixtures for the msgspec/from_dict comparison: name -> (file bytes,
+# whether the typed decoder should accept it rather than fall back).
+_DECODE_FIXTURES = {
+    "unknown_fields": (
+        json.dumps({
+            "version": 1, "next_id": 3, "extra": {"a": 1},
+            "tasks": [
+                {"id": 1, "text": "a", "color": "red", "tags": ["x"]},
+                {"id": 2, "text": "b", "done": True, "bug_status": "open", "meta": None},
+            ],
+        }).encode(),
+        True,
+    ),
+    "missing_fields": (json.dumps({"tasks": [{"id": 1, "text": "a"}]}).encode(), True),
+    "nulls": (
+        json.dumps({"version": 1, "next_id": 2, "tasks": [{"id": 1, "text": "a", "due": None, "tags": None}]}).encode(),
+        False,
+    ),
+    "legacy_types": (
+        json.dumps({"version": 1, "next_id": "2", "tasks": [{"id": "1", "text": "a", "done": 1}]}).encode(),
+        False,
+    ),
+    "empty": (b"", False),
+    "whitespace": (b"  \n\t", False),
+    "bad_json": (b'{"tasks": [', False),
+}
+
+
+@pytest.mark.parametrize("name", sorted(_DECODE_FIXTURES))
+def test_msgspec_decode_matches_from_dict(name):
+    msgspec = pytest.importorskip("msgspec")
+    from todo_cli import storage
+    from todo_cli.model import Task
+
+    raw, decodes = _DECODE_FIXTURES[name]
+    if decodes:
+        storage._db_decoder.decode(raw)
+    else:
+        with pytest.raises(msgspec.DecodeError):
+            storage._db_decoder.decode(raw)
+
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "todos.json"
+        db_path.write_bytes(raw)
+        db = storage.load_db(db_path)
+        expected = (int(db["next_id"]), [Task.from_dict(t).to_dict() for t in db["tasks"]])
+
+        next_id, tasks = storage.load_tasks(db_path)
+        assert (next_id, [t.to_dict() for t in tasks]) == expected
+
+
 def test_sort_due_overdue_first_then_upcoming_then_none():
     from todo_cli.model import Task
     from todo_cli.storage import sort_tasks